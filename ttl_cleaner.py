@@ -15,17 +15,537 @@ Usage: python ttl_cleaner.py input.ttl
 
 import re
 import sys
-import argparse
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
-from collections import defaultdict, Counter
+from typing import Dict, List, Set, Tuple, Optional, Iterator, Iterable, Sequence, Union
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import chain, islice
+from collections import defaultdict, deque, Counter
 import urllib.parse
 import shutil
+import codecs
+import html
+import gc
+import os
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+
+# Read buffer size for streaming input in memory-efficient mode (also the output and report file buffer)
+STREAM_BUFFER_SIZE = 1 << 20
+# Concept lines joined into one output fragment (no per-concept joined strings)
+OUTPUT_FRAGMENT_LINES = 4096
+# Chunks processed between full garbage collections in memory-efficient mode
+GC_COLLECT_INTERVAL = 10
+# Bounds of the automatic --chunk-size (see _auto_chunk_size); the upper bound keeps several
+# chunks per large vocabulary, so chunked validation can still use all worker processes
+MIN_AUTO_CHUNK_SIZE = 1000
+MAX_AUTO_CHUNK_SIZE = 10000
+# Rough memory per parsed concept, including its change log entries and index data
+AVG_CONCEPT_BYTES = 4096
+# Share of the available RAM one chunk may take with the automatic --chunk-size
+AUTO_CHUNK_RAM_FRACTION = 0.05
+
+# Precompiled regexes for the per-concept hot paths
+# Concept subject at the start of a block (blocks are sliced to begin at their subject)
+_RE_CONCEPT_URI = re.compile(r'(<[^>]+>|[a-zA-Z0-9_:/-]+)\s+a\s+skos:Concept')
+_RE_SUBJECT_START = re.compile(r'^[ \t]*((?:<[^>]+>|[a-zA-Z0-9_:/-]+)\s+a\s+skos:Concept(Scheme)?\b)', re.MULTILINE)
+# Standalone '.' line; blocks start at their subject, so the line always follows a newline
+_RE_BLOCK_END = re.compile(r'\n[ \t]*\.[ \t]*$', re.MULTILINE)
+_RE_COMMENT_LINE = re.compile(r'^[ \t]*#.*\n?', re.MULTILINE)
+# @prefix declaration at the start of a line (leading whitespace allowed)
+_RE_PREFIX_LINE = re.compile(r'^[^\S\n]*(@prefix[^\n]*)', re.MULTILINE)
+
+# Bytes variants for scanning the memory-mapped input in memory-efficient mode
+_RE_BASE_BYTES = re.compile(rb'@base\s+<[^>]+>\s*\.')
+_RE_PREFIX_BYTES = re.compile(rb'@prefix[^\r\n]*')
+_RE_SUBJECT_START_BYTES = re.compile(rb'^[ \t]*((?:<[^>]+>|[a-zA-Z0-9_:/-]+)\s+a\s+skos:Concept(Scheme)?\b)', re.MULTILINE)
+
+# Literal-valued SKOS properties: property name, first literal (text, lang), then the rest of the
+# object list, which is empty for the common single-literal case; _RE_LITERAL tokenizes the rest.
+# Only the two-letter primary language is kept, but longer tags ("de-DE", "deu") are consumed
+# so the object list continues after them.
+# The list pattern is unambiguous (one way to match each separator), so matching stays linear
+# on malformed input such as unterminated literals.
+_RE_LITERAL_PROPERTY = re.compile(
+    r'skos:(prefLabel|altLabel|definition|note|scopeNote|editorialNote|historyNote|changeNote|example)'
+    r'\s+"([^"]+)"(?:@([a-z]{2})[-A-Za-z0-9]*)?((?:\s*(?:,\s*)?"[^"]+"(?:@[a-z]{2}[-A-Za-z0-9]*)?)*)'
+)
+# Any mention of a literal-valued property; lines containing one are handled by the literal scan
+_RE_LITERAL_PROPERTY_NAME = re.compile(
+    r'skos:(?:prefLabel|altLabel|definition|note|scopeNote|editorialNote|historyNote|changeNote|example)'
+)
+_RE_LITERAL = re.compile(r'"([^"]+)"(?:@([a-z]{2})[-A-Za-z0-9]*)?')
+_LITERAL_PROPERTY_FIELDS = {
+    'prefLabel': 'prefLabels',
+    'altLabel': 'altLabels',
+    'definition': 'definitions',
+    'note': 'notes',
+    'scopeNote': 'scopeNotes',
+    'editorialNote': 'editorialNotes',
+    'historyNote': 'historyNotes',
+    'changeNote': 'changeNotes',
+    'example': 'examples',
+}
+
+# Literal properties in output order: (Concept field, start of the TTL property up to the opening
+# quote, stats counter). text_fields_cleaned for examples is counted by _fix_comma_spacing.
+_LITERAL_OUTPUT = (
+    ('prefLabels', 'skos:prefLabel "', 'labels_processed'),
+    ('altLabels', 'skos:altLabel "', 'labels_processed'),
+    ('definitions', 'skos:definition "', 'definitions_processed'),
+    ('notes', 'skos:note "', 'notes_processed'),
+    ('scopeNotes', 'skos:scopeNote "', 'notes_processed'),
+    ('editorialNotes', 'skos:editorialNote "', 'notes_processed'),
+    ('historyNotes', 'skos:historyNote "', 'notes_processed'),
+    ('changeNotes', 'skos:changeNote "', 'notes_processed'),
+    ('examples', 'skos:example "', None),
+)
+
+# N-Triples output (output_format 'nt')
+_SKOS_NS = 'http://www.w3.org/2004/02/skos/core#'
+_XSD_NS = 'http://www.w3.org/2001/XMLSchema#'
+_NT_RDF_TYPE = '<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>'
+_NT_SKOS_CONCEPT = f'<{_SKOS_NS}Concept>'
+_NT_LITERAL_PREDICATES = {attr: f'<{_SKOS_NS}{prop}>' for prop, attr in _LITERAL_PROPERTY_FIELDS.items()}
+# Prefixes the Turtle output declares when the input has none
+_DEFAULT_PREFIXES = {'skos': _SKOS_NS, 'esco': 'http://data.europa.eu/esco/'}
+_RE_PREFIX_DECL = re.compile(r'@prefix\s+([A-Za-z][\w.-]*)?:\s*<([^>]*)>')
+_RE_ABSOLUTE_IRI = re.compile(r'[A-Za-z][A-Za-z0-9+.-]*:')
+# One Turtle term or separator of a predicate-object list (no blank nodes, collections or
+# long strings); the local part of a prefixed name may not end with '.'
+_RE_TURTLE_TERM = re.compile(r"""\s*(?:
+    <(?P<iri>[^<>"{}|^`\\\s]*)>
+  | (?P<quote>["'])(?P<lit>(?:(?!(?P=quote))[^\\\n\r]|\\.)*)(?P=quote)
+        (?:@(?P<lang>[A-Za-z]+(?:-[A-Za-z0-9]+)*)|\^\^(?P<dt><[^<>\s]*>|(?:[A-Za-z][\w.-]*)?:(?:[\w:%-]|\.(?=[\w:%-]))*))?
+  | (?P<num>[+-]?(?:\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?))
+  | (?P<punct>[,;.])
+  | (?P<name>a(?=\s)|true\b|false\b|(?:[A-Za-z][\w.-]*)?:(?:[\w:%-]|\.(?=[\w:%-]))*)
+)""", re.VERBOSE)
+# Literal text keeps the Turtle escapes of the input (valid in N-Triples too); anything else that
+# N-Triples does not allow raw in a string is escaped: a lone backslash, quote, CR/LF and other
+# control characters (as \uXXXX)
+_RE_NT_LITERAL_ESCAPE = re.compile(r'\\(?:[tbnrf"\'\\]|u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8})|[\\"\x00-\x1f\x7f]')
+_NT_LITERAL_ESCAPES = {
+    **{chr(c): f'\\u{c:04X}' for c in (*range(0x20), 0x7F)},
+    '\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r',
+}
+# Long strings ("""...""" / '''...''') are not covered by _RE_TURTLE_TERM
+_RE_LONG_STRING_QUOTE = re.compile(r'"""|\'\'\'')
+_RE_UNESCAPED_DOUBLE_QUOTE = re.compile(r'(\\.)|"')
+
+# Punctuation spacing fixes
+# One scan for ',' ';' (always), '.' (not at end or before a digit) and '!' '?' (not at end);
+# each mark's lookahead only sees the character after it, so the passes were independent
+_RE_PUNCT_NO_SPACE = re.compile(r'[,;](?!\s)|\.(?!\s|$|\d)|[!?](?!\s|$)')
+_RE_NUMERIC_RATIO = re.compile(r'(\d+):(\d+)')
+_RE_GENDER_COLON = re.compile(r'(?i)([A-Za-zÄÖÜäöüß][\wÄÖÜäöüß-]*)\:(in|innen)\b')
+_RE_COLON_NO_SPACE = re.compile(r':(?!\s|$)')
+# Anything the punctuation/whitespace normalization could change: a punctuation mark, whitespace
+# other than a plain space, or a space that is doubled or at either end
+_RE_NEEDS_NORMALIZATION = re.compile(r'[,.;:!?]|[^\S ]|  |^ | $')
+
+# Mojibake fixes (UTF-8 read as Latin-1) for labels and text fields; text fields also decode
+# HTML entities (see _RE_HTML_ENTITY)
+_ENCODING_FIXES = {
+    'Ã¤': 'ä', 'Ã¶': 'ö', 'Ã¼': 'ü',
+    'Ã„': 'Ä', 'Ã–': 'Ö', 'Ãœ': 'Ü',
+    'ÃŸ': 'ß', 'Ã©': 'é', 'Ã¨': 'è',
+    'Ã¡': 'á', 'Ã ': 'à', 'Ã³': 'ó',
+    'Ã²': 'ò', 'Ãº': 'ú', 'Ã¹': 'ù'
+}
+# Single-scan alternation over the fix table (longest sequence first)
+_RE_ENCODING_FIXES = re.compile('|'.join(map(re.escape, sorted(_ENCODING_FIXES, key=len, reverse=True))))
+# Complete (';'-terminated) named and numeric character references; legacy names without ';'
+# are left alone so query strings like '?a=1&region=eu' survive
+_RE_HTML_ENTITY = re.compile(r'&(?:#\d+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]*);')
+
+# Validation and hierarchy helpers
+# Characters of an unbracketed (prefixed-name) ConceptScheme subject
+_SCHEME_SUBJECT_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_:/-')
+_RE_HAS_TOP_CONCEPT = re.compile(r'skos:hasTopConcept\s+<([^>]+)>')
+_RE_TRAILING_CODE = re.compile(r'(\d+(?:-\d+)*)$')
+_RE_URI_ANGLE = re.compile(r'<([^>]+)>')
+# http(s) URI with a non-empty authority that urlparse accepts as netloc as-is
+_RE_HTTP_AUTHORITY = re.compile(r'https?://[^/?#\[\]\t\r\n]+(?:[/?#]|$)')
+_RE_LANG_TAG = re.compile(r'[a-z]{2,3}(-[A-Za-z0-9]{1,8})*$')
+# UTF-8 umlauts decoded as Latin-1 (Ã¤, Ã¶, Ã¼, ÃŸ), reported by the label quality check
+_RE_MOJIBAKE_LABEL = re.compile('Ã[¤¶¼Ÿ]')
+
+# Relations indexed once for all validators: predicate (first token of an other_properties
+# entry) -> index key
+_INDEXED_RELATIONS = {
+    'skos:broader': 'broader_by_uri',
+    'skos:narrower': 'narrower_by_uri',
+    'skos:related': 'related_by_uri',
+    'skos:inScheme': 'in_scheme_by_uri',
+    'skos:topConceptOf': 'top_concept_of_by_uri',
+}
+
+# Section rule of the console validation report
+_REPORT_RULE = "=" * 60
+
+# Validation summary categories in report order: (name, message prefix). The two scheme
+# findings without a prefix start with "Concept <uri>" and are matched by their wording.
+_SUMMARY_CATEGORIES = (
+    ("S14 prefLabel duplicates", "S14 Violation"),
+    ("S13 pref/alt overlap", "S13 Violation"),
+    ("URI format invalid", "Invalid URI format"),
+    ("Language tag possibly invalid", "Potentially invalid language tag"),
+    ("S27 broader+related conflict", "S27 Violation"),
+    ("Simple hierarchy cycles", "Simple cycle detected"),
+    ("Hierarchy gap (missing intermediate level)", "Hierarchy gap"),
+    ("Hierarchy: missing broader to prefix", "Inconsistent hierarchy"),
+    ("Hierarchy: parent missing narrower", "Parent missing skos:narrower"),
+    ("Scheme: topConceptOf without inScheme", None),
+    ("Scheme: hasTopConcept -> non-Concept", "hasTopConcept points to non-Concept"),
+    ("Scheme: hasTopConcept target missing inScheme", None),
+    ("Label warning: very long", "Very long label"),
+    ("Label warning: empty", "Empty label"),
+    ("Label warning: encoding issue", "Potential encoding issue"),
+    ("Label warning: looks like URI", "Label looks like URI"),
+)
+_SUMMARY_BY_PREFIX = {prefix: name for name, prefix in _SUMMARY_CATEGORIES if prefix}
+_RE_SUMMARY_PREFIX = re.compile('|'.join(re.escape(prefix) for prefix in _SUMMARY_BY_PREFIX))
+
+# Validators run by clean_ttl_file, in report order:
+# (method name, description, detail for the start message, takes the shared validation index)
+_VALIDATORS = (
+    ('_validate_skos_integrity', 'SKOS integrity validation', '', False),
+    ('_validate_semantic_relations', 'semantic relations validation', '', True),
+    ('_validate_datatypes_and_uris', 'datatypes and URIs validation', '', False),
+    ('_validate_skos_xl_labels', 'SKOS-XL validation', '', True),
+    ('_validate_hierarchy_gaps', 'hierarchy validation', ' (missing levels, broader/narrower consistency)', True),
+    ('_validate_scheme_consistency', 'scheme consistency validation', ' (inScheme/topConceptOf, hasTopConcept)', True),
+)
+
+@dataclass(slots=True)
+class Concept:
+    """Parsed SKOS concept. Label and note entries are dicts with 'text' and 'lang'."""
+    uri: str
+    prefLabels: List[Dict] = field(default_factory=list)
+    altLabels: List[Dict] = field(default_factory=list)
+    definitions: List[Dict] = field(default_factory=list)
+    notes: List[Dict] = field(default_factory=list)
+    scopeNotes: List[Dict] = field(default_factory=list)
+    editorialNotes: List[Dict] = field(default_factory=list)
+    historyNotes: List[Dict] = field(default_factory=list)
+    changeNotes: List[Dict] = field(default_factory=list)
+    examples: List[Dict] = field(default_factory=list)
+    other_properties: List[str] = field(default_factory=list)  # Store all other SKOS properties
+    issues: List[str] = field(default_factory=list)
+    # Subject token as written in the input (kept for N-Triples output only)
+    raw_uri: Optional[str] = None
+
+class _ChangeLogSpool:
+    """List-like change log that writes each entry to a spool file as soon as it is added
+    (already numbered, in report format) and only keeps the entry count in memory.
+    The reports copy the spool file into their change log section.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._count = 0
+        self._file = open(path, 'w', encoding='utf-8', buffering=STREAM_BUFFER_SIZE)
+
+    def append(self, entry: str) -> None:
+        self._count += 1
+        self._file.write(f"{self._count:4d}. {entry}\n")
+
+    def extend(self, entries: Iterable[str]) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getstate__(self) -> Dict:
+        # Parallel validation workers receive a copy of the cleaner but never log changes
+        return {'path': self.path, '_count': self._count, '_file': None}
+
+    def write_to(self, f) -> None:
+        """Copy the numbered entries written so far into the open text file f."""
+        self._file.flush()
+        with open(self.path, 'r', encoding='utf-8') as spool:
+            shutil.copyfileobj(spool, f, STREAM_BUFFER_SIZE)
+
+    def close(self) -> None:
+        """Close and delete the spool file (the entry count stays available)."""
+        self._file.close()
+        self.path.unlink(missing_ok=True)
+
+class _ChangeCounter:
+    """Change log stand-in that only counts entries (used when no change report is wanted)."""
+
+    def __init__(self):
+        self._count = 0
+
+    def append(self, entry: str) -> None:
+        self._count += 1
+
+    def extend(self, entries) -> None:
+        self._count += len(entries)
+
+    def __len__(self) -> int:
+        return self._count
+
+def _replace_encoding_fix(m: re.Match) -> str:
+    return _ENCODING_FIXES[m.group(0)]
+
+def _replace_html_entity(m: re.Match) -> str:
+    entity = m.group(0)
+    decoded = html.unescape(entity)
+    # A quote or backslash would end or escape the output literal; only &quot; is decoded (as before)
+    if decoded in ('"', '\\') and entity != '&quot;':
+        return entity
+    return decoded
+
+def _normalize_punctuation_and_whitespace(text: str) -> str:
+    """Add the missing space after , . ; : ! ? and collapse whitespace runs, trimming both ends
+    (the shared core of text field and comma spacing cleanup; no stats or logging).
+    Periods in abbreviations/decimals, numeric ratios (1:1) and German gender-colon forms
+    (Lehrer:innen) are left alone.
+    """
+    # Most text is already clean: one probe scan instead of the punctuation and split passes
+    if not _RE_NEEDS_NORMALIZATION.search(text):
+        return text
+    text = _RE_PUNCT_NO_SPACE.sub(r'\g<0> ', text)
+    if ':' in text:
+        # Protect numeric ratios (e.g., 1:1, 10:30)
+        text = _RE_NUMERIC_RATIO.sub(r'\1<NO_SPACE_COLON>\2', text)
+        # Protect German gender-colon forms (:in, :innen)
+        text = _RE_GENDER_COLON.sub(r'\1<NO_SPACE_COLON>\2', text)
+        # Now add space after remaining colons (but not at end)
+        text = _RE_COLON_NO_SPACE.sub(': ', text)
+        # Restore protected colons
+        text = text.replace('<NO_SPACE_COLON>', ':')
+    # Collapse whitespace runs and trim both ends (str.split, no regex)
+    return ' '.join(text.split())
+
+def _numbered_lines(entries: Sequence[str]) -> Iterator[str]:
+    """Report lines for entries, numbered from 1 ('   1. entry'), for f.writelines."""
+    return (f"{i:4d}. {entry}\n" for i, entry in enumerate(entries, 1))
+
+def _log_excerpt(text: str) -> str:
+    """Trimmed text for a change log entry, truncated to 120 chars.
+    str.strip returns the string itself when there is nothing to trim, so already clean
+    values (the usual cleaned side of a change) are not copied.
+    """
+    text = text.strip()
+    return text[:117] + '...' if len(text) > 120 else text
+
+def _nt_term(m: re.Match, prefixes: Dict[str, str], base_uri: Optional[str]) -> Optional[str]:
+    """N-Triples form of a term matched by _RE_TURTLE_TERM (None if it cannot be expanded).
+    Relative IRIs are resolved against base_uri, prefixed names against prefixes.
+    """
+    iri = m.group('iri')
+    if iri is not None:
+        if base_uri and not _RE_ABSOLUTE_IRI.match(iri):
+            iri = urllib.parse.urljoin(base_uri, iri)
+        return f'<{iri}>'
+    lit = m.group('lit')
+    if lit is not None:
+        if m.group('quote') == "'":
+            # Single-quoted Turtle string: escape the double quotes it may contain
+            lit = _RE_UNESCAPED_DOUBLE_QUOTE.sub(lambda e: e.group(1) or '\\"', lit)
+        if m.group('lang'):
+            return f'"{lit}"@{m.group("lang")}'
+        dt = m.group('dt')
+        if dt:
+            dt_term = _nt_term(_RE_TURTLE_TERM.match(dt), prefixes, base_uri)
+            return f'"{lit}"^^{dt_term}' if dt_term else None
+        return f'"{lit}"'
+    num = m.group('num')
+    if num is not None:
+        kind = 'double' if 'e' in num.lower() else 'decimal' if '.' in num else 'integer'
+        return f'"{num}"^^<{_XSD_NS}{kind}>'
+    name = m.group('name')
+    if name == 'a':
+        return _NT_RDF_TYPE
+    if name in ('true', 'false'):
+        return f'"{name}"^^<{_XSD_NS}boolean>'
+    prefix, _, local = name.partition(':')
+    namespace = prefixes.get(prefix)
+    return f'<{namespace}{local}>' if namespace is not None else None
+
+def _replace_nt_literal_escape(m: re.Match) -> str:
+    token = m.group(0)
+    # Existing escape sequences are kept; single characters are escaped
+    return token if len(token) > 1 else _NT_LITERAL_ESCAPES[token]
+
+def _nt_literal(text: str) -> str:
+    """Escape literal text for use between the quotes of an N-Triples string."""
+    return _RE_NT_LITERAL_ESCAPE.sub(_replace_nt_literal_escape, text)
+
+def _nt_subject(token: str, prefixes: Dict[str, str], base_uri: Optional[str]) -> Optional[str]:
+    """N-Triples form of a Turtle subject token (IRI or prefixed name), resolved exactly like
+    objects by _nt_term; None if the token is neither or cannot be expanded.
+    """
+    m = _RE_TURTLE_TERM.fullmatch(token)
+    if not m or (m.group('iri') is None and m.group('name') in (None, 'a', 'true', 'false')):
+        return None
+    return _nt_term(m, prefixes, base_uri)
+
+def _turtle_to_ntriples(subject: str, text: str, prefixes: Dict[str, str], base_uri: Optional[str]) -> Optional[List[str]]:
+    """Convert a Turtle predicate-object list about subject (an N-Triples term) into N-Triples
+    lines, e.g. 'skos:broader <a>, <b>' or a whole 'p1 o1 ; p2 o2 .' list.
+    Returns None for syntax the converter does not cover (blank nodes, collections,
+    long strings, undeclared prefixes).
+    """
+    if _RE_LONG_STRING_QUOTE.search(text):
+        return None
+    lines: List[str] = []
+    predicate = None
+    # Expected next: 'predicate', 'object', 'separator' (after an object) or 'end' (after '.')
+    state = 'predicate'
+    pos = 0
+    end = len(text.rstrip())
+    while pos < end:
+        m = _RE_TURTLE_TERM.match(text, pos)
+        if not m or state == 'end':
+            return None
+        pos = m.end()
+        punct = m.group('punct')
+        if punct:
+            if state == 'separator':
+                state = {',': 'object', ';': 'predicate', '.': 'end'}[punct]
+            elif not (state == 'predicate' and punct == ';'):
+                return None
+            continue
+        if state == 'predicate':
+            # Only IRIs, prefixed names and 'a' can be predicates
+            if m.group('iri') is None and m.group('name') in (None, 'true', 'false'):
+                return None
+            predicate = _nt_term(m, prefixes, base_uri)
+            if predicate is None:
+                return None
+            state = 'object'
+        elif state == 'object':
+            term = _nt_term(m, prefixes, base_uri)
+            if term is None:
+                return None
+            lines.append(f'{subject} {predicate} {term} .')
+            state = 'separator'
+        else:
+            return None
+    return None if state == 'object' else lines
+
+def _strip_angles(token: str) -> str:
+    """Remove one enclosing '<' / '>' from a URI token (unlike strip('<>'), never more)."""
+    return token.removeprefix('<').removesuffix('>')
+
+@lru_cache(maxsize=65536)
+def _clean_uri_cached(uri: str, base_uri: Optional[str]) -> str:
+    """Clean and normalize URI against base_uri (memoized; scheme and relation targets repeat)."""
+    uri = uri.strip()
+    
+    # Remove angle brackets if present
+    if uri.startswith('<') and uri.endswith('>'):
+        uri = uri[1:-1]
+    
+    # If URI doesn't start with http, it might be relative to @base
+    if not uri.startswith('http'):
+        if base_uri and not ':' in uri:
+            # Relative URI - combine with @base
+            uri = f"{base_uri.rstrip('/')}/{uri}"
+        elif ':' in uri:
+            # Prefixed URI like esco:123
+            prefix, local = uri.split(':', 1)
+            if prefix == 'esco':
+                uri = f"http://data.europa.eu/esco/skill/{local}"
+            else:
+                uri = f"http://example.org/{prefix}/{local}"
+        else:
+            # Plain ID, use @base if available, otherwise default ESCO prefix
+            if base_uri:
+                uri = f"{base_uri.rstrip('/')}/{uri}"
+            else:
+                uri = f"http://data.europa.eu/esco/skill/{uri}"
+    
+    return uri
+
+@lru_cache(maxsize=65536)
+def _extract_numeric_code_cached(uri_or_token: str) -> Optional[str]:
+    """Trailing code token of a URI or token (memoized; relation targets repeat across concepts)."""
+    s = uri_or_token.strip()
+    # If enclosed in angle brackets, strip them
+    if s.startswith('<') and s.endswith('>'):
+        s = s[1:-1]
+    # If full URI, take last path segment
+    if '/' in s:
+        s = s.rstrip('/').split('/')[-1]
+    # Now extract trailing token: digits with optional hyphen-separated segments
+    m = _RE_TRAILING_CODE.search(s)
+    return m.group(1) if m else None
+
+@lru_cache(maxsize=None)
+def _code_prefixes_cached(code: str) -> Tuple[str, ...]:
+    """Parent code prefixes of a code token, longest first (see TTLCleaner._code_prefixes)."""
+    prefixes: List[str] = []
+    if '-' in code:
+        parts = code.split('-')
+        # Build segment-based prefixes, excluding the full code
+        for i in range(len(parts) - 1, 0, -1):
+            prefixes.append('-'.join(parts[:i]))
+        # Also include numeric fallbacks from the first segment (e.g., '42' -> '4')
+        first = parts[0]
+        if first.isdigit() and len(first) > 1:
+            for k in range(len(first) - 1, 0, -1):
+                prefixes.append(first[:k])
+    else:
+        # Plain digits: progressively shorter prefixes
+        if code.isdigit() and len(code) > 1:
+            for k in range(len(code) - 1, 0, -1):
+                prefixes.append(code[:k])
+    # Keep order from longest to shortest, de-duplicated while preserving order
+    return tuple(dict.fromkeys(prefixes))
+
+# Below this many concepts validators run serially (process start-up would dominate)
+PARALLEL_MIN_CONCEPTS = 1000
+# Largest batch of concept blocks sent to one parse worker (--parse-workers); independent of
+# --chunk-size so that large chunks still spread over all workers
+PARSE_BATCH_SIZE = 1000
+
+# Per-process state for parallel parsing and validation (set by _init_worker)
+_worker_state: Dict = {}
+
+def _init_worker(cleaner, concepts, index) -> None:
+    """Process pool initializer: receive the cleaner, concepts and index once per worker."""
+    _worker_state['cleaner'] = cleaner
+    _worker_state['concepts'] = concepts
+    _worker_state['index'] = index
+
+def _run_validator_in_worker(method_name: str, uses_index: bool) -> Tuple[List[str], List[str], List[str]]:
+    """Run a single TTLCleaner validator in a worker process.
+    Returns (violations, warnings, infos); infos are collected separately because the
+    worker's cleaner is a copy and its validation_infos do not reach the parent process.
+    """
+    cleaner = _worker_state['cleaner']
+    concepts = _worker_state['concepts']
+    cleaner.validation_infos = []
+    args = (concepts, _worker_state['index']) if uses_index else (concepts,)
+    violations, warnings = getattr(cleaner, method_name)(*args)
+    return violations, warnings, cleaner.validation_infos
+
+def _parse_blocks_in_worker(blocks: List[str]) -> Tuple[List[Concept], Dict[str, int], object, int]:
+    """Parse a batch of concept blocks in a worker process.
+    Returns (concepts, stats, change_log, unlogged changes) of this batch only; the parent
+    merges them in batch order, so the result matches a serial run.
+    """
+    cleaner = _worker_state['cleaner']
+    cleaner.stats = dict.fromkeys(cleaner.stats, 0)
+    cleaner.change_log = [] if cleaner.collect_change_log else _ChangeCounter()
+    cleaner._unlogged_changes = 0
+    concepts = [c for c in map(cleaner._parse_concept_block, blocks) if c]
+    return concepts, cleaner.stats, cleaner.change_log, cleaner._unlogged_changes
+
+def _validate_chunk_in_worker(chunk: List[Concept]) -> Tuple[List[str], List[str]]:
+    """Run the per-chunk validators of TTLCleaner._validate_chunk on one chunk in a worker process."""
+    return _worker_state['cleaner']._validate_chunk(chunk)
 
 class TTLCleaner:
     """Clean and validate TTL files with SKOS integrity checks and performance optimizations."""
     
-    def __init__(self, chunk_size=1000, enable_validation=True, memory_efficient=False, enable_skos_xl=False, autofix_broader=False, warn_missing_narrower: bool = False, preserve_byte_identity: bool = False, semantic_check: bool = False):
+    def __init__(self, chunk_size=1000, enable_validation=True, memory_efficient=False, enable_skos_xl=False, autofix_broader=False, warn_missing_narrower: bool = False, preserve_byte_identity: bool = False, semantic_check: bool = False, parallel: bool = True, verbose_changelog: bool = True, stream_change_log: bool = False, collect_change_log: bool = True, parse_workers: int = 1, output_format: str = 'ttl'):
         self.stats = {
             'total_concepts': 0,
             'duplicates_removed': 0,
@@ -44,12 +564,16 @@ class TTLCleaner:
         }
         self.errors = []
         self.warnings = []
-        self.change_log = []
+        # If False (CLI: --no-reports), change log entries are only counted, never formatted or kept
+        self.collect_change_log = collect_change_log
+        self.change_log = [] if collect_change_log else _ChangeCounter()
         self.validation_violations = []
         self.validation_warnings = []
         self.validation_infos = []
         self.base_declaration = None
         self.concept_scheme = None
+        # @prefix lines collected while streaming (memory-efficient mode)
+        self.prefix_declarations = []
         self.other_metadata = []
         # Base URI (from @base) for resolving relative URIs
         self.base_uri = None
@@ -59,6 +583,10 @@ class TTLCleaner:
         self.enable_validation = enable_validation
         self.memory_efficient = memory_efficient
         self.processed_chunks = 0
+        # Run validators in worker processes for large vocabularies
+        self.parallel = parallel
+        # Worker processes for parsing concept blocks (1 = parse in this process)
+        self.parse_workers = parse_workers
         
         # SKOS-XL support
         self.enable_skos_xl = enable_skos_xl
@@ -73,42 +601,42 @@ class TTLCleaner:
 
         # Output behavior
         self.preserve_byte_identity = preserve_byte_identity
+        # 'ttl' (Turtle, default) or 'nt' (N-Triples: one triple with absolute IRIs per line)
+        self.output_format = output_format
         # Semantic graph comparison (rdflib isomorphism)
         self.semantic_check = semantic_check
+        # If False, label/text field fixes are only counted in the stats (no per-entry change log)
+        self.verbose_changelog = verbose_changelog
+        # Text changes made while verbose_changelog is off (keeps passthrough detection correct)
+        self._unlogged_changes = 0
+        # If True (and reports are written), change log entries go to a spool file next to the
+        # output as they are made instead of being kept in memory until the reports are written
+        self.stream_change_log = stream_change_log
 
-    def clean_ttl_file(self, input_path: str, output_path: Optional[str] = None, generate_reports: bool = True) -> bool:
+    def clean_ttl_file(self, input_path: Union[str, Path], output_path: Optional[Union[str, Path]] = None, generate_reports: bool = True) -> bool:
         """Clean TTL file and save cleaned version."""
+        # URI cache entries are only useful within one file
+        _clean_uri_cached.cache_clear()
+        _extract_numeric_code_cached.cache_clear()
+        _code_prefixes_cached.cache_clear()
         try:
             # Generate default output path with _cleaned suffix if not provided
             if output_path is None:
-                input_path_obj = Path(input_path)
-                output_path = str(input_path_obj.parent / f"{input_path_obj.stem}_cleaned{input_path_obj.suffix}")
+                input_path = Path(input_path)
+                suffix = '.nt' if self.output_format == 'nt' else input_path.suffix
+                output_path = input_path.parent / f"{input_path.stem}_cleaned{suffix}"
+            else:
+                output_path = Path(output_path)
+            # Common prefix of the report files: <output dir>/<output stem>
+            report_prefix = str(output_path.parent / output_path.stem)
             
-            # Read input file
-            content = self._read_file_with_encoding(input_path)
-            if not content:
-                return False
-
-            print(f"[INFO] Processing: {input_path}")
-            print(f"[INFO] Original file size: {len(content)} characters")
-
-            # Extract and clean concepts (with chunked processing for large files)
-            concepts = self._extract_concepts(content)
+            if self.stream_change_log and generate_reports and self.collect_change_log:
+                self.change_log = _ChangeLogSpool(Path(f"{report_prefix}_changes.log.part"))
             
-            if self.memory_efficient and len(concepts) > self.chunk_size:
-                cleaned_concepts = self._clean_concepts_chunked(concepts)
-            else:
-                cleaned_concepts = self._clean_concepts(concepts)
-
-            # Optional autofix: add missing skos:broader links to the nearest prefix parent
-            if self.autofix_broader:
-                try:
-                    print("[INFO] Applying hierarchy autofix for missing skos:broader links...")
-                    added = self._apply_hierarchy_autofix(cleaned_concepts)
-                    print(f"[INFO] Autofix complete. Broader links added: {added}")
-                except Exception as e:
-                    print(f"[DEBUG] Error during hierarchy autofix: {e}")
-                    raise
+            loaded = self._load_and_clean(input_path)
+            if loaded is None:
+                return False
+            cleaned_concepts, content, index = loaded
 
             # Perform SKOS validation (if enabled)
             all_violations = []
@@ -116,74 +644,7 @@ class TTLCleaner:
             self.validation_infos = []
             
             if self.enable_validation:
-                if self.memory_efficient and len(cleaned_concepts) > self.chunk_size:
-                    # Chunked validation for large datasets
-                    violations, warnings = self._validate_concepts_chunked(cleaned_concepts)
-                else:
-                    # Standard validation with debug output
-                    try:
-                        print("[DEBUG] Starting SKOS integrity validation...")
-                        violations, warnings = self._validate_skos_integrity(cleaned_concepts)
-                        all_violations.extend(violations)
-                        all_warnings.extend(warnings)
-                        print(f"[DEBUG] SKOS integrity validation completed: {len(violations)} violations, {len(warnings)} warnings")
-                    except Exception as e:
-                        print(f"[DEBUG] Error in SKOS integrity validation: {e}")
-                        raise
-                    
-                    try:
-                        print("[DEBUG] Starting semantic relations validation...")
-                        violations, warnings = self._validate_semantic_relations(cleaned_concepts)
-                        all_violations.extend(violations)
-                        all_warnings.extend(warnings)
-                        print(f"[DEBUG] Semantic relations validation completed: {len(violations)} violations, {len(warnings)} warnings")
-                    except Exception as e:
-                        print(f"[DEBUG] Error in semantic relations validation: {e}")
-                        raise
-                    
-                    try:
-                        print("[DEBUG] Starting datatypes and URIs validation...")
-                        violations, warnings = self._validate_datatypes_and_uris(cleaned_concepts)
-                        all_violations.extend(violations)
-                        all_warnings.extend(warnings)
-                        print(f"[DEBUG] Datatypes and URIs validation completed: {len(violations)} violations, {len(warnings)} warnings")
-                    except Exception as e:
-                        print(f"[DEBUG] Error in datatypes and URIs validation: {e}")
-                        raise
-                    
-                    # SKOS-XL validation if enabled
-                    if self.enable_skos_xl:
-                        try:
-                            print("[DEBUG] Starting SKOS-XL validation...")
-                            violations, warnings = self._validate_skos_xl_labels(cleaned_concepts)
-                            all_violations.extend(violations)
-                            all_warnings.extend(warnings)
-                            print(f"[DEBUG] SKOS-XL validation completed: {len(violations)} violations, {len(warnings)} warnings")
-                        except Exception as e:
-                            print(f"[DEBUG] Error in SKOS-XL validation: {e}")
-                            raise
-                    
-                    # Hierarchy gap and parent-child consistency validation
-                    try:
-                        print("[DEBUG] Starting hierarchy validation (missing levels, broader/narrower consistency)...")
-                        violations, warnings = self._validate_hierarchy_gaps(cleaned_concepts)
-                        all_violations.extend(violations)
-                        all_warnings.extend(warnings)
-                        print(f"[DEBUG] Hierarchy validation completed: {len(violations)} violations, {len(warnings)} warnings")
-                    except Exception as e:
-                        print(f"[DEBUG] Error in hierarchy validation: {e}")
-                        raise
-                    
-                    # ConceptScheme consistency validation (inScheme/topConceptOf, hasTopConcept integrity)
-                    try:
-                        print("[DEBUG] Starting scheme consistency validation (inScheme/topConceptOf, hasTopConcept)...")
-                        violations, warnings = self._validate_scheme_consistency(cleaned_concepts)
-                        all_violations.extend(violations)
-                        all_warnings.extend(warnings)
-                        print(f"[DEBUG] Scheme consistency validation completed: {len(violations)} violations, {len(warnings)} warnings")
-                    except Exception as e:
-                        print(f"[DEBUG] Error in scheme consistency validation: {e}")
-                        raise
+                all_violations, all_warnings = self._validate(cleaned_concepts, index)
                 
                 # Store validation results
                 self.validation_violations = all_violations
@@ -191,11 +652,6 @@ class TTLCleaner:
             else:
                 print("[INFO] SKOS validation disabled for performance")
 
-            # Generate output path if not provided
-            if not output_path:
-                input_file = Path(input_path)
-                output_path = input_file.parent / f"{input_file.stem}_cleaned{input_file.suffix}"
-
             # Write cleaned file (with optional passthrough to preserve original bytes if no transformations)
             self._write_cleaned_file(cleaned_concepts, content, output_path, input_path)
 
@@ -234,23 +690,148 @@ class TTLCleaner:
             if generate_reports:
                 # Write change log if changes were made
                 if self.change_log:
-                    log_path = Path(output_path).parent / f"{Path(output_path).stem}_changes.log"
-                    self._write_change_log(log_path)
+                    self._write_change_log(f"{report_prefix}_changes.log")
                 
                 # Write validation report if validation was enabled (even when zero findings)
                 if self.enable_validation:
-                    validation_path = Path(output_path).parent / f"{Path(output_path).stem}_validation.log"
-                    self._write_validation_report(validation_path, all_violations, all_warnings, self.validation_infos)
+                    self._write_validation_report(f"{report_prefix}_validation.log", all_violations, all_warnings, self.validation_infos)
                 
                 # Write combined full report
-                full_log_path = Path(output_path).parent / f"{Path(output_path).stem}_full.log"
-                self._write_combined_report(str(full_log_path), input_path, output_path, all_violations, all_warnings, self.validation_infos)
+                self._write_combined_report(f"{report_prefix}_full.log", input_path, output_path, all_violations, all_warnings, self.validation_infos)
 
             return True
 
         except Exception as e:
             print(f"[ERROR] Error processing file: {e}")
             return False
+        
+        finally:
+            if isinstance(self.change_log, _ChangeLogSpool):
+                self.change_log.close()
+
+    def validate_only(self, input_path: Union[str, Path]) -> bool:
+        """Parse, clean and validate a TTL file without writing the cleaned file or any report.
+        Results are kept in validation_violations/_warnings/_infos and the report is printed.
+        """
+        _clean_uri_cached.cache_clear()
+        _extract_numeric_code_cached.cache_clear()
+        _code_prefixes_cached.cache_clear()
+        try:
+            loaded = self._load_and_clean(input_path)
+            if loaded is None:
+                return False
+            cleaned_concepts, _, index = loaded
+            self.validation_infos = []
+            self.validation_violations, self.validation_warnings = self._validate(cleaned_concepts, index)
+            print(self._generate_validation_report(self.validation_violations, self.validation_warnings, self.validation_infos))
+            return True
+        except Exception as e:
+            print(f"[ERROR] Error processing file: {e}")
+            return False
+
+    def _load_and_clean(self, input_path: Union[str, Path]) -> Optional[Tuple[List[Concept], str, Optional[Dict]]]:
+        """Read, parse and clean the concepts of a TTL file (plus the optional broader autofix).
+        Returns (cleaned concepts, original content or its @prefix lines, validation index if
+        the autofix already built it), or None if the file could not be read.
+        """
+        if self.memory_efficient:
+            # Stream concept blocks from disk instead of loading the whole file
+            encoding = self._detect_encoding(input_path)
+            if not encoding:
+                return None
+
+            print(f"[INFO] Processing: {input_path}")
+            print(f"[INFO] Original file size: {Path(input_path).stat().st_size} bytes")
+
+            concepts = self._extract_concepts_streaming(input_path, encoding)
+            # Only the @prefix declarations of the original content are needed for output
+            content = '\n'.join(self.prefix_declarations)
+        else:
+            # Read input file
+            content = self._read_file_with_encoding(input_path)
+            if not content:
+                return None
+
+            print(f"[INFO] Processing: {input_path}")
+            print(f"[INFO] Original file size: {len(content)} characters")
+
+            # Extract and clean concepts (with chunked processing for large files)
+            concepts = self._extract_concepts(content)
+        
+        if self.memory_efficient and len(concepts) > self.chunk_size:
+            cleaned_concepts = self._clean_concepts_chunked(concepts)
+        else:
+            cleaned_concepts = self._clean_concepts(concepts)
+        self._count_final_concepts()
+
+        # Shared lookup indexes (URIs, relations, codes), built once for autofix and validators
+        index = None
+
+        # Optional autofix: add missing skos:broader links to the nearest prefix parent
+        if self.autofix_broader:
+            try:
+                print("[INFO] Applying hierarchy autofix for missing skos:broader links...")
+                index = self._build_validation_indexes(cleaned_concepts)
+                added = self._apply_hierarchy_autofix(cleaned_concepts, index)
+                print(f"[INFO] Autofix complete. Broader links added: {added}")
+            except Exception as e:
+                print(f"[DEBUG] Error during hierarchy autofix: {e}")
+                raise
+
+        return cleaned_concepts, content, index
+
+    def _validate(self, concepts: List[Concept], index: Optional[Dict]) -> Tuple[List[str], List[str]]:
+        """Run SKOS validation on the cleaned concepts; returns (violations, warnings)."""
+        if self.memory_efficient and len(concepts) > self.chunk_size:
+            # Chunked validation for large datasets
+            return self._validate_concepts_chunked(concepts, index)
+        if index is None:
+            index = self._build_validation_indexes(concepts)
+        return self._run_validators(concepts, index)
+
+    def _run_validators(self, concepts: List[Concept], index: Dict) -> Tuple[List[str], List[str]]:
+        """Run all enabled validators (see _VALIDATORS) in their fixed order.
+        Large vocabularies are validated in parallel worker processes when enabled;
+        results are always merged in validator order so reports stay deterministic.
+        """
+        validators = [v for v in _VALIDATORS if self.enable_skos_xl or v[0] != '_validate_skos_xl_labels']
+        workers = min(len(validators), os.cpu_count() or 1)
+        
+        if self.parallel and workers > 1 and len(concepts) >= PARALLEL_MIN_CONCEPTS:
+            print(f"[DEBUG] Running {len(validators)} validators in parallel ({workers} workers)...")
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self, concepts, index)) as executor:
+                futures = [executor.submit(_run_validator_in_worker, v[0], v[3]) for v in validators]
+                results = []
+                for (method_name, name, detail, uses_index), future in zip(validators, futures):
+                    try:
+                        violations, warnings, infos = future.result()
+                    except Exception as e:
+                        print(f"[DEBUG] Error in {name}: {e}")
+                        raise
+                    # Info-level findings recorded by the worker copy of the cleaner
+                    self.validation_infos.extend(infos)
+                    print(f"[DEBUG] {name[0].upper() + name[1:]} completed: {len(violations)} violations, {len(warnings)} warnings")
+                    results.append((violations, warnings))
+        else:
+            results = []
+            for method_name, name, detail, uses_index in validators:
+                try:
+                    print(f"[DEBUG] Starting {name}{detail}...")
+                    args = (concepts, index) if uses_index else (concepts,)
+                    violations, warnings = getattr(self, method_name)(*args)
+                    print(f"[DEBUG] {name[0].upper() + name[1:]} completed: {len(violations)} violations, {len(warnings)} warnings")
+                except Exception as e:
+                    print(f"[DEBUG] Error in {name}: {e}")
+                    raise
+                results.append((violations, warnings))
+        
+        all_violations: List[str] = []
+        all_warnings: List[str] = []
+        for violations, warnings in results:
+            all_violations.extend(violations)
+            all_warnings.extend(warnings)
+        return all_violations, all_warnings
 
     def clean_file(self, file_path: str) -> Tuple[str, Dict]:
         """Clean TTL file and return content and stats (for Streamlit integration)."""
@@ -263,6 +844,7 @@ class TTLCleaner:
             # Extract and clean concepts
             concepts = self._extract_concepts(content)
             cleaned_concepts = self._clean_concepts(concepts)
+            self._count_final_concepts()
 
             # Generate cleaned content
             cleaned_content = self._generate_cleaned_content(cleaned_concepts, content)
@@ -273,16 +855,54 @@ class TTLCleaner:
             print(f"[ERROR] Error processing file: {e}")
             return content, self.stats
 
-    def _read_file_with_encoding(self, file_path: str) -> Optional[str]:
-        """Read file with multiple encoding attempts."""
+    def _count_final_concepts(self) -> None:
+        """Set stats['final_concepts'] (concepts left after removing duplicates and concepts without prefLabel)."""
+        stats = self.stats
+        stats['final_concepts'] = stats['total_concepts'] - stats['duplicates_removed'] - stats['concepts_without_preflabel']
+
+    def _read_file_with_encoding(self, file_path: Union[str, Path]) -> Optional[str]:
+        """Read file with multiple encoding attempts.
+        The raw bytes are read once; fallback encodings decode the same buffer instead of
+        re-reading the file.
+        """
         encodings = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252', 'iso-8859-1']
 
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except Exception as e:
+            self.errors.append(f"Error reading file: {e}")
+            print("[ERROR] Could not read file with any encoding")
+            return None
+
         for encoding in encodings:
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                print(f"[OK] File read successfully with encoding: {encoding}")
-                return content
+                content = data.decode(encoding)
+            except UnicodeDecodeError:
+                continue
+            if '\r' in content:
+                # Match the universal-newline handling of text-mode reads
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            print(f"[OK] File read successfully with encoding: {encoding}")
+            return content
+
+        print("[ERROR] Could not read file with any encoding")
+        return None
+
+    def _detect_encoding(self, file_path: Union[str, Path]) -> Optional[str]:
+        """Detect file encoding with the same fallback order as _read_file_with_encoding,
+        decoding incrementally so the file is never held in memory as a whole."""
+        encodings = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252', 'iso-8859-1']
+
+        for encoding in encodings:
+            try:
+                decoder = codecs.getincrementaldecoder(encoding)()
+                with open(file_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(STREAM_BUFFER_SIZE), b''):
+                        decoder.decode(chunk)
+                    decoder.decode(b'', final=True)
+                print(f"[OK] File encoding detected: {encoding}")
+                return encoding
             except UnicodeDecodeError:
                 continue
             except Exception as e:
@@ -291,7 +911,55 @@ class TTLCleaner:
         print("[ERROR] Could not read file with any encoding")
         return None
 
-    def _extract_concepts(self, content: str) -> List[Dict]:
+    def _iter_concept_blocks(self, file_path: Union[str, Path], encoding: str) -> Iterator[str]:
+        """Yield concept blocks one at a time from a memory-mapped input file.
+        Subject anchors, @prefix lines and @base are found with bytes regexes directly on the
+        mapping; each block is kept as a (start, end) offset pair and only decoded when yielded.
+        Block boundaries mirror _split_into_concept_blocks. All supported input encodings are
+        ASCII-compatible, so the ASCII-only patterns are safe to run on the raw bytes.
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for m in _RE_BASE_BYTES.finditer(mm):
+                    # Same line-start rule as _extract_base_uri
+                    line_start = mm.rfind(b'\n', 0, m.start()) + 1
+                    if not mm[line_start:m.start()].strip():
+                        self.base_uri = self._extract_base_uri(m.group(0).decode(encoding))
+                        break
+                for m in _RE_PREFIX_BYTES.finditer(mm):
+                    # Only @prefix at the start of a line (leading whitespace allowed)
+                    line_start = mm.rfind(b'\n', 0, m.start()) + 1
+                    if not mm[line_start:m.start()].strip():
+                        self.prefix_declarations.append(m.group(0).decode(encoding).strip())
+
+                anchors = [(m.start(), m.start(1), bool(m.group(2))) for m in _RE_SUBJECT_START_BYTES.finditer(mm)]
+                for idx, (_, start, is_scheme) in enumerate(anchors):
+                    end = anchors[idx + 1][0] if idx + 1 < len(anchors) else len(mm)
+                    block = mm[start:end].decode(encoding)
+                    if '\r' in block:
+                        # Match the universal-newline handling of text-mode reads
+                        block = block.replace('\r\n', '\n').replace('\r', '\n')
+                    end_match = _RE_BLOCK_END.search(block)
+                    if end_match:
+                        block = block[:end_match.end()]
+                    block = block.strip()
+                    if not block:
+                        continue
+                    if is_scheme:
+                        # ConceptScheme metadata, as collected by _extract_metadata for full reads
+                        self._extract_metadata(block)
+                        continue
+                    yield block
+
+    def _extract_concepts_streaming(self, file_path: Union[str, Path], encoding: str) -> List[Concept]:
+        """Extract SKOS concepts by streaming concept blocks from disk (memory-efficient mode)."""
+        concepts, total = self._parse_concept_blocks(self._iter_concept_blocks(file_path, encoding))
+        self.stats['total_concepts'] = total
+        return concepts
+
+    def _extract_concepts(self, content: str) -> List[Concept]:
         """Extract SKOS concepts from TTL content."""
         concepts = []
 
@@ -305,45 +973,78 @@ class TTLCleaner:
         blocks = self._split_into_concept_blocks(content)
         self.stats['total_concepts'] = len(blocks)
 
-        for block in blocks:
-            concept = self._parse_concept_block(block)
-            if concept:
-                concepts.append(concept)
-
-        
+        concepts, _ = self._parse_concept_blocks(blocks)
         return concepts
     
+    def _parse_concept_blocks(self, blocks: Iterable[str]) -> Tuple[List[Concept], int]:
+        """Parse concept blocks in order; returns (concepts, number of blocks).
+        With parse_workers > 1, batches of min(chunk_size, PARSE_BATCH_SIZE) blocks are parsed in
+        worker processes and their stats and change log entries are merged in batch order. Only a few batches are in
+        flight at a time, so streamed blocks are not all read ahead.
+        """
+        concepts: List[Concept] = []
+        if self.parse_workers <= 1:
+            total = 0
+            for block in blocks:
+                total += 1
+                concept = self._parse_concept_block(block)
+                if concept:
+                    concepts.append(concept)
+            return concepts, total
+        
+        blocks = iter(blocks)
+        batch_size = min(self.chunk_size, PARSE_BATCH_SIZE)
+        batches = iter(lambda: list(islice(blocks, batch_size)), [])
+        # The first batch is read before the pool starts: streaming sets base_uri on the first
+        # block, and the workers receive a copy of the cleaner
+        first_batch = next(batches, None)
+        if first_batch is None:
+            return concepts, 0
+        total = 0
+        
+        def merge(result) -> None:
+            batch_concepts, stats, change_log, unlogged = result
+            concepts.extend(batch_concepts)
+            for key, count in stats.items():
+                self.stats[key] += count
+            self.change_log.extend(change_log)
+            self._unlogged_changes += unlogged
+        
+        print(f"[INFO] Parsing concept blocks in {self.parse_workers} worker processes (batches of {batch_size})")
+        with ProcessPoolExecutor(max_workers=self.parse_workers, initializer=_init_worker,
+                                 initargs=(self, None, None)) as executor:
+            pending = deque()
+            for batch in chain((first_batch,), batches):
+                total += len(batch)
+                pending.append(executor.submit(_parse_blocks_in_worker, batch))
+                if len(pending) >= 2 * self.parse_workers:
+                    merge(pending.popleft().result())
+            while pending:
+                merge(pending.popleft().result())
+        return concepts, total
+    
     def _extract_base_uri(self, content: str) -> Optional[str]:
-        """Extract @base URI from TTL content."""
-        base_match = re.search(r'(@base\s+<[^>]+>\s*\.)', content)
-        if base_match:
-            self.base_declaration = base_match.group(1)
-            uri_match = re.search(r'@base\s+<([^>]+)>\s*\.', content)
-            if uri_match:
-                base_uri = uri_match.group(1)
-                print(f"[INFO] Found @base URI: {base_uri}")
-                return base_uri
+        """Extract @base URI from TTL content.
+        Uses plain str.find scans; only a declaration at the start of a line (leading
+        whitespace allowed) counts, so '@base' inside literals or comments is ignored.
+        """
+        pos = content.find('@base')
+        while pos >= 0:
+            line_start = content.rfind('\n', 0, pos) + 1
+            lt = content.find('<', pos + 5)
+            gt = content.find('>', lt + 1) if lt >= 0 else -1
+            dot = content.find('.', gt + 1) if gt >= 0 else -1
+            if dot >= 0 and gt > lt + 1:
+                if (not content[line_start:pos].strip()
+                        and content[pos + 5:lt].isspace()
+                        and not content[gt + 1:dot].strip()):
+                    self.base_declaration = content[pos:dot + 1]
+                    base_uri = content[lt + 1:gt]
+                    print(f"[INFO] Found @base URI: {base_uri}")
+                    return base_uri
+            pos = content.find('@base', pos + 5)
         return None
     
-    def _fix_comma_spacing(self, text: str) -> str:
-        """Fix comma spacing in text - ensure space after comma."""
-        if not text:
-            return text
-            
-        original = text
-        # Replace comma without space with comma + space
-        # But avoid double spaces
-        fixed = re.sub(r',(?!\s)', ', ', text)
-        # Clean up multiple spaces
-        fixed = re.sub(r'\s+', ' ', fixed)
-        
-        # Count fixes and log changes
-        if fixed != original:
-            self.stats['comma_fixes'] += 1
-            self.change_log.append(f"Comma spacing fixed: '{original}' → '{fixed.strip()}'")
-            
-        return fixed.strip()
-    
     def _extract_metadata(self, content: str) -> None:
         """Extract ConceptScheme and other metadata from TTL content."""
         lines = content.split('\n')
@@ -368,174 +1069,97 @@ class TTLCleaner:
                     current_block = []
     
     def _split_into_concept_blocks(self, content: str) -> List[str]:
-        """Split TTL content into individual concept blocks."""
-        # Remove comments and empty lines
-        lines = []
-        for line in content.split('\n'):
-            line = line.strip()
-            if line and not line.startswith('#'):
-                lines.append(line)
-        
-        # Find concept boundaries
+        """Split TTL content into individual concept blocks.
+        A single scan finds all subject anchors (Concept and ConceptScheme); each concept
+        block runs to the next anchor and is cut after a standalone '.' line if present.
+        """
+        anchors = list(_RE_SUBJECT_START.finditer(content))
         blocks = []
-        current_block = []
         
-        for line in lines:
-            # Match various URI formats: <uuid>, prefix:id, or full URIs
-            if re.match(r'^(<[^>]+>|[a-zA-Z0-9_:/-]+)\s+a\s+skos:Concept', line):
-                # Start of new concept
-                if current_block:
-                    blocks.append('\n'.join(current_block))
-                current_block = [line]
-            elif line.strip() == '.' and current_block:
-                # End of concept
-                current_block.append(line)
-                blocks.append('\n'.join(current_block))
-                current_block = []
-            elif current_block:
-                # Part of current concept
-                current_block.append(line)
-        
-        # Add last block if exists
-        if current_block:
-            blocks.append('\n'.join(current_block))
+        for idx, m in enumerate(anchors):
+            if m.group(2):
+                # ConceptScheme is handled by _extract_metadata
+                continue
+            end = anchors[idx + 1].start() if idx + 1 < len(anchors) else len(content)
+            block = content[m.start(1):end]
+            # End of concept: standalone '.' line, drop any trailing non-concept tail
+            end_match = _RE_BLOCK_END.search(block)
+            if end_match:
+                block = block[:end_match.end()]
+            block = block.strip()
+            if block:
+                blocks.append(block)
         
         return blocks
     
-    def _parse_concept_block(self, block: str) -> Optional[Dict]:
+    def _parse_concept_block(self, block: str) -> Optional[Concept]:
         """Parse individual concept block."""
-        concept = {
-            'uri': None,
-            'prefLabels': [],
-            'altLabels': [],
-            'definitions': [],
-            'notes': [],
-            'scopeNotes': [],
-            'editorialNotes': [],
-            'historyNotes': [],
-            'changeNotes': [],
-            'examples': [],
-            'other_properties': [],  # Store all other SKOS properties
-            'raw_block': block,
-            'issues': []
-        }
+        # Drop full-line comments (blocks are sliced from the raw content)
+        if '#' in block:
+            block = _RE_COMMENT_LINE.sub('', block)
         
         # Extract URI - handle various formats
-        uri_match = re.search(r'^(<[^>]+>|[a-zA-Z0-9_:/-]+)\s+a\s+skos:Concept', block, re.MULTILINE)
-        if uri_match:
-            raw_uri = uri_match.group(1).strip()
-            cleaned_uri = self._clean_uri(raw_uri)
-            concept['uri'] = cleaned_uri
-            if raw_uri != cleaned_uri:
-                # Classify and log URI change; only count and log when classifier provides a message
-                is_fix, msg = self._classify_uri_change(raw_uri, cleaned_uri)
-                if msg:
-                    concept['issues'].append('URI fixed' if is_fix else 'URI normalized')
-                    self.change_log.append(msg)
-                    if is_fix:
-                        self.stats['malformed_uris_fixed'] += 1
-                    else:
-                        self.stats['uri_normalizations'] += 1
-        else:
-            concept['issues'].append('No URI found')
+        uri_match = _RE_CONCEPT_URI.match(block)
+        if not uri_match:
             return None
+        raw_uri = uri_match.group(1).strip()
+        cleaned_uri = self._clean_uri(raw_uri)
+        concept = Concept(cleaned_uri)
+        if self.output_format == 'nt':
+            # N-Triples subjects are resolved like the objects (see _nt_subject)
+            concept.raw_uri = raw_uri
+        if raw_uri != cleaned_uri:
+            # Classify and log URI change; only count and log when classifier provides a message
+            is_fix, msg = self._classify_uri_change(raw_uri, cleaned_uri)
+            if msg:
+                concept.issues.append('URI fixed' if is_fix else 'URI normalized')
+                self.change_log.append(msg)
+                if is_fix:
+                    self.stats['malformed_uris_fixed'] += 1
+                else:
+                    self.stats['uri_normalizations'] += 1
         
-        # Extract prefLabels
-        pref_labels = re.findall(r'skos:prefLabel\s+"([^"]+)"(?:@([a-z]{2}))?', block)
-        for label, lang in pref_labels:
-            cleaned_label = self._clean_label(label)
-            if cleaned_label:
-                concept['prefLabels'].append({'text': cleaned_label, 'lang': lang or 'en'})
-        
-        # Also capture comma-separated multi-object prefLabel lists across lines
-        # Example: skos:prefLabel "Foo"@de , "Bar"@en ;
-        for m in re.finditer(r'skos:prefLabel\s+', block):
-            tail = block[m.end():]
-            end_match = re.search(r'[;\.]', tail)
-            segment = tail[:end_match.start()] if end_match else tail
-            for lbl, lng in re.findall(r'"([^"]+)"(?:@([a-z]{2}))?', segment):
-                cleaned = self._clean_label(lbl)
-                if cleaned:
-                    entry = {'text': cleaned, 'lang': lng or 'en'}
-                    if entry not in concept['prefLabels']:
-                        concept['prefLabels'].append(entry)
-        
-        # Extract altLabels
-        alt_labels = re.findall(r'skos:altLabel\s+"([^"]+)"(?:@([a-z]{2}))?', block)
-        for label, lang in alt_labels:
-            cleaned_label = self._clean_label(label)
-            if cleaned_label:
-                concept['altLabels'].append({'text': cleaned_label, 'lang': lang or 'en'})
-        
-        # Also capture comma-separated multi-object altLabel lists across lines
-        # Example: skos:altLabel "Alt 1"@de , "Alt 2"@de ;
-        for m in re.finditer(r'skos:altLabel\s+', block):
-            tail = block[m.end():]
-            end_match = re.search(r'[;\.]', tail)
-            segment = tail[:end_match.start()] if end_match else tail
-            for lbl, lng in re.findall(r'"([^"]+)"(?:@([a-z]{2}))?', segment):
-                cleaned = self._clean_label(lbl)
+        # Concepts without any prefLabel are dropped below; skip the literal and property scans
+        if 'skos:prefLabel' not in block:
+            concept.issues.append('No prefLabel found')
+            self.stats['concepts_without_preflabel'] += 1
+            return None
+        
+        # Extract all literal-valued properties (labels, definitions, notes, examples) in one pass.
+        # Each match covers the full object list, e.g. skos:prefLabel "Foo"@de , "Bar"@en ;
+        # Set-based de-duplication: raw literals are cleaned (and logged) only once,
+        # cleaned (text, lang) pairs are added only once per property
+        raw_seen = set()
+        seen = set()
+        for prop, first_text, first_lang, rest in _RE_LITERAL_PROPERTY.findall(block):
+            attr = _LITERAL_PROPERTY_FIELDS[prop]
+            is_label = attr in ('prefLabels', 'altLabels')
+            clean = self._clean_label if is_label else self._clean_text_field
+            literals = [(first_text, first_lang)]
+            if rest:
+                literals.extend(_RE_LITERAL.findall(rest))
+            for text, lang in literals:
+                # Language tags come from regex groups (a new str per literal); intern them so the
+                # few distinct tags are shared and compare by identity in dict/set lookups
+                lang = sys.intern(lang) if lang else 'en'
+                raw_key = (prop, text, lang)
+                if raw_key in raw_seen:
+                    continue
+                raw_seen.add(raw_key)
+                cleaned = clean(text)
                 if cleaned:
-                    entry = {'text': cleaned, 'lang': lng or 'en'}
-                    if entry not in concept['altLabels']:
-                        concept['altLabels'].append(entry)
-        
-        # Extract definitions
-        definitions = re.findall(r'skos:definition\s+"([^"]+)"(?:@([a-z]{2}))?', block)
-        for definition, lang in definitions:
-            cleaned_definition = self._clean_text_field(definition)
-            if cleaned_definition:
-                concept['definitions'].append({'text': cleaned_definition, 'lang': lang or 'en'})
-        
-        # Extract notes
-        notes = re.findall(r'skos:note\s+"([^"]+)"(?:@([a-z]{2}))?', block)
-        for note, lang in notes:
-            cleaned_note = self._clean_text_field(note)
-            if cleaned_note:
-                concept['notes'].append({'text': cleaned_note, 'lang': lang or 'en'})
-        
-        # Extract scopeNotes
-        scope_notes = re.findall(r'skos:scopeNote\s+"([^"]+)"(?:@([a-z]{2}))?', block)
-        for note, lang in scope_notes:
-            cleaned_note = self._clean_text_field(note)
-            if cleaned_note:
-                concept['scopeNotes'].append({'text': cleaned_note, 'lang': lang or 'en'})
-        
-        # Extract editorialNotes
-        editorial_notes = re.findall(r'skos:editorialNote\s+"([^"]+)"(?:@([a-z]{2}))?', block)
-        for note, lang in editorial_notes:
-            cleaned_note = self._clean_text_field(note)
-            if cleaned_note:
-                concept['editorialNotes'].append({'text': cleaned_note, 'lang': lang or 'en'})
-        
-        # Extract historyNotes
-        history_notes = re.findall(r'skos:historyNote\s+"([^"]+)"(?:@([a-z]{2}))?', block)
-        for note, lang in history_notes:
-            cleaned_note = self._clean_text_field(note)
-            if cleaned_note:
-                concept['historyNotes'].append({'text': cleaned_note, 'lang': lang or 'en'})
-        
-        # Extract changeNotes
-        change_notes = re.findall(r'skos:changeNote\s+"([^"]+)"(?:@([a-z]{2}))?', block)
-        for note, lang in change_notes:
-            cleaned_note = self._clean_text_field(note)
-            if cleaned_note:
-                concept['changeNotes'].append({'text': cleaned_note, 'lang': lang or 'en'})
-        
-        # Extract examples
-        examples = re.findall(r'skos:example\s+"([^"]+)"(?:@([a-z]{2}))?', block)
-        for example, lang in examples:
-            cleaned_example = self._clean_text_field(example)
-            if cleaned_example:
-                concept['examples'].append({'text': cleaned_example, 'lang': lang or 'en'})
+                    key = (prop, cleaned, lang)
+                    if key not in seen:
+                        seen.add(key)
+                        getattr(concept, attr).append({'text': cleaned, 'lang': lang})
         
         # Extract all other SKOS properties (exactMatch, narrower, broader, etc.)
         # Parse multi-line properties correctly
-        concept['other_properties'] = self._parse_multiline_properties(block)
+        concept.other_properties = self._parse_multiline_properties(block)
         
         # Validate concept
-        if not concept['prefLabels']:
-            concept['issues'].append('No prefLabel found')
+        if not concept.prefLabels:
+            concept.issues.append('No prefLabel found')
             self.stats['concepts_without_preflabel'] += 1
             return None
         
@@ -546,13 +1170,6 @@ class TTLCleaner:
         properties = []
         lines = block.split('\n')
         
-        # Skip text fields that are already processed
-        skip_patterns = [
-            'skos:prefLabel', 'skos:altLabel', 'skos:definition', 'skos:note',
-            'skos:scopeNote', 'skos:editorialNote', 'skos:historyNote', 
-            'skos:changeNote', 'skos:example'
-        ]
-        
         i = 0
         while i < len(lines):
             line = lines[i].strip()
@@ -565,7 +1182,7 @@ class TTLCleaner:
                 continue
             
             # Skip already processed text fields
-            if any(pattern in line for pattern in skip_patterns):
+            if _RE_LITERAL_PROPERTY_NAME.search(line):
                 i += 1
                 continue
             
@@ -601,55 +1218,101 @@ class TTLCleaner:
             i += 1
         
         return properties
-    
-    def _validate_skos_integrity(self, concepts: List[Dict]) -> Tuple[List[str], List[str]]:
+
+    def _build_validation_indexes(self, concepts: List[Concept]) -> Dict:
+        """Build lookup indexes shared by the validators in a single pass over all concepts.
+        Returns a dict with:
+        - 'all_uris': set of concept URIs
+        - '<relation>_by_uri' for broader, narrower, related, inScheme, topConceptOf:
+          concept URI -> list of target tokens (with <>), in property order; an empty map
+          doubles as the "no such relation" flag validators use to return early
+        - 'code_to_uri' / 'uri_to_code': numeric code token maps (see _extract_numeric_code)
+        - 'broader_codes' / 'narrower_codes': source code -> set of target codes, for
+          concepts and targets that both carry a code token
+        """
+        index: Dict = {'all_uris': set(), 'code_to_uri': {}, 'uri_to_code': {}}
+        for key in _INDEXED_RELATIONS.values():
+            index[key] = {}
+
+        for c in concepts:
+            uri = c.uri
+            if not uri:
+                continue
+            index['all_uris'].add(uri)
+            code = self._extract_numeric_code(uri)
+            if code:
+                index['code_to_uri'][code] = uri
+                index['uri_to_code'][uri] = code
+            for prop in c.other_properties:
+                # Every property string starts with its predicate: one dict lookup per property
+                key = _INDEXED_RELATIONS.get(prop.partition(' ')[0])
+                if key:
+                    # Interned: parent and scheme tokens repeat across many concepts, so the
+                    # index holds one string per distinct target and equality hits identity
+                    targets = [sys.intern(t) for t in self._extract_uris_from_property(prop) if t]
+                    if targets:
+                        index[key].setdefault(uri, []).extend(targets)
+
+        # Code-level hierarchy edges, so the hierarchy checks do no string parsing of their own
+        uri_to_code = index['uri_to_code']
+        for relation_key, code_key in (('broader_by_uri', 'broader_codes'), ('narrower_by_uri', 'narrower_codes')):
+            code_map: Dict[str, Set[str]] = defaultdict(set)
+            for src_uri, tgt_uris in index[relation_key].items():
+                src_code = uri_to_code.get(src_uri)
+                if not src_code:
+                    continue
+                for tgt_uri_like in tgt_uris:
+                    tgt_code = self._extract_numeric_code(tgt_uri_like)
+                    if tgt_code:
+                        code_map[src_code].add(tgt_code)
+            index[code_key] = code_map
+
+        return index
+
+    def _validate_skos_integrity(self, concepts: List[Concept]) -> Tuple[List[str], List[str]]:
         """Validate SKOS integrity conditions (S14, S13, etc.) with enhanced error reporting."""
         violations = []
         warnings = []
         
         for concept in concepts:
-            uri = concept.get('uri', 'unknown')
+            uri = concept.uri
             
             # S14: At most one value of skos:prefLabel per language tag
-            pref_labels = concept.get('prefLabels', [])
-            if pref_labels:
-                lang_counts = {}
-                lang_labels = {}
-                
-                for label_obj in pref_labels:
-                    text = label_obj.get('text', '')
-                    lang = label_obj.get('lang', 'en')
-                    lang_counts[lang] = lang_counts.get(lang, 0) + 1
-                    if lang not in lang_labels:
-                        lang_labels[lang] = []
-                    lang_labels[lang].append(text)
-                
-                for lang, count in lang_counts.items():
-                    if count > 1:
+            pref_labels = concept.prefLabels
+            if len(pref_labels) > 1:
+                lang_counts = Counter(label_obj.get('lang', 'en') for label_obj in pref_labels)
+                dupes = {lang: count for lang, count in lang_counts.items() if count > 1}
+
+                # Only collect label texts for languages that actually have duplicates
+                if dupes:
+                    lang_labels = defaultdict(list)
+                    for label_obj in pref_labels:
+                        lang = label_obj.get('lang', 'en')
+                        if lang in dupes:
+                            lang_labels[lang].append(label_obj.get('text', ''))
+
+                    for lang, count in dupes.items():
                         labels_list = ', '.join([f'"{label}"' for label in lang_labels[lang]])
                         violations.append(
                             f"S14 Violation: <{uri}> has {count} prefLabels for language '{lang}': {labels_list}. "
                             f"Suggestion: Keep only one prefLabel per language, move others to altLabel."
                         )
-            
+
             # S13: Disjoint label properties with detailed reporting
-            pref_set = set()
-            alt_set = set()
+            alt_labels = concept.altLabels
             hidden_set = set()
-            
-            for label_obj in pref_labels:
-                text = label_obj.get('text', '')
-                lang = label_obj.get('lang', 'en')
-                pref_set.add((text, lang))
-            
-            for label_obj in concept.get('altLabels', []):
-                text = label_obj.get('text', '')
-                lang = label_obj.get('lang', 'en')
-                alt_set.add((text, lang))
-            
+
             # Note: hiddenLabels not currently parsed in _parse_concept_block
             # This would need to be added if hiddenLabel support is required
             
+            # Overlaps need at least two non-empty label properties; most concepts only have
+            # prefLabels, so the (text, lang) sets are only built when there is something to compare
+            if alt_labels or hidden_set:
+                pref_set = {(label_obj.get('text', ''), label_obj.get('lang', 'en')) for label_obj in pref_labels}
+                alt_set = {(label_obj.get('text', ''), label_obj.get('lang', 'en')) for label_obj in alt_labels}
+            else:
+                pref_set = alt_set = set()
+            
             # Check overlaps with detailed suggestions
             pref_alt_overlap = pref_set & alt_set
             pref_hidden_overlap = pref_set & hidden_set
@@ -677,8 +1340,7 @@ class TTLCleaner:
                 )
             
             # Enhanced label quality warnings
-            all_label_objects = pref_labels + concept.get('altLabels', [])
-            for label_obj in all_label_objects:
+            for label_obj in chain(pref_labels, alt_labels):
                 label_text = label_obj.get('text', '')
                 
                 if len(label_text) > 500:
@@ -693,14 +1355,14 @@ class TTLCleaner:
                     )
                 
                 # Check for potential encoding issues
-                if any(char in label_text for char in ['Ã¤', 'Ã¶', 'Ã¼', 'ÃŸ']):
+                if 'Ã' in label_text and _RE_MOJIBAKE_LABEL.search(label_text):
                     warnings.append(
                         f"Potential encoding issue in <{uri}>: '{label_text}'. "
                         f"Suggestion: Check UTF-8 encoding of source data."
                     )
                 
-                # Check for suspicious patterns
-                if label_text.lower().startswith(('http://', 'https://')):
+                # Check for suspicious patterns (lower-case only the prefix, labels can be long)
+                if label_text[:8].lower().startswith(('http://', 'https://')):
                     warnings.append(
                         f"Label looks like URI in <{uri}>: '{label_text}'. "
                         f"Suggestion: Use skos:exactMatch for URI mappings instead."
@@ -708,7 +1370,7 @@ class TTLCleaner:
         
         return violations, warnings
     
-    def _validate_scheme_consistency(self, concepts: List[Dict]) -> Tuple[List[str], List[str]]:
+    def _validate_scheme_consistency(self, concepts: List[Concept], index: Optional[Dict] = None) -> Tuple[List[str], List[str]]:
         """Validate inScheme/topConceptOf consistency and hasTopConcept integrity.
         - If a concept has skos:topConceptOf S, it must also have skos:inScheme S.
         - For each skos:hasTopConcept on the ConceptScheme, the target must be a Concept
@@ -718,201 +1380,173 @@ class TTLCleaner:
         warnings: List[str] = []
         infos: List[str] = []
         
-        # Build quick lookups for concepts and their scheme relations
-        concept_uris: Set[str] = set()
-        in_scheme: Dict[str, Set[str]] = defaultdict(set)  # concept_uri -> set of scheme URIs (with <>)
-        top_of: Dict[str, Set[str]] = defaultdict(set)     # concept_uri -> set of scheme URIs (with <>)
-        
-        for c in concepts:
-            uri = c.get('uri', '')
-            if not uri:
-                continue
-            concept_uris.add(uri)
-            for prop in c.get('other_properties', []):
-                if 'skos:inScheme ' in prop:
-                    scheme_uris = getattr(self, '_extract_uris_from_property', lambda p: [self._extract_uri_from_property(p)] if self._extract_uri_from_property(p) else [])(prop)
-                    for scheme_uri in scheme_uris:
-                        if scheme_uri:
-                            in_scheme[uri].add(scheme_uri)
-                if 'skos:topConceptOf ' in prop:
-                    scheme_uris = getattr(self, '_extract_uris_from_property', lambda p: [self._extract_uri_from_property(p)] if self._extract_uri_from_property(p) else [])(prop)
-                    for scheme_uri in scheme_uris:
-                        if scheme_uri:
-                            top_of[uri].add(scheme_uri)
+        # Quick lookups for concepts and their scheme relations (shared validation indexes)
+        if index is None:
+            index = self._build_validation_indexes(concepts)
+        # Nothing to check without topConceptOf links or hasTopConcept on the scheme
+        scheme_has_top_concepts = bool(self.concept_scheme) and 'skos:hasTopConcept' in self.concept_scheme
+        if not index['top_concept_of_by_uri'] and not scheme_has_top_concepts:
+            return violations, warnings
+        concept_uris: Set[str] = index['all_uris']
+        # concept_uri -> set of scheme URIs, normalized once with _clean_uri to bare absolute URIs
+        # (one key space for <relative>, <absolute> and resolved forms); the few distinct
+        # scheme URIs are interned so the set lookups compare by identity
+        clean_uri = self._clean_uri
+        in_scheme: Dict[str, Set[str]] = {
+            uri: {sys.intern(clean_uri(t)) for t in tokens} for uri, tokens in index['in_scheme_by_uri'].items()
+        }
+        # concept_uri -> set of scheme tokens (with <>), as written, for reporting
+        top_of: Dict[str, Set[str]] = {uri: set(t) for uri, t in index['top_concept_of_by_uri'].items()}
         
         # Check: topConceptOf implies inScheme for same scheme
         for concept_uri, schemes in top_of.items():
             for scheme_token in schemes:
-                if scheme_token not in in_scheme.get(concept_uri, set()):
+                if clean_uri(scheme_token) not in in_scheme.get(concept_uri, ()):
                     violations.append(
                         f"Concept <{concept_uri}> has topConceptOf {scheme_token} but is missing inScheme {scheme_token}"
                     )
         
         # Parse hasTopConcept relations from the ConceptScheme block (metadata)
-        if self.concept_scheme:
+        if scheme_has_top_concepts:
             # Attempt to extract the scheme subject URI
-            scheme_subject = None
-            first_line = self.concept_scheme.split('\n', 1)[0].strip()
-            m = re.match(r'^(<[^>]+>|[a-zA-Z0-9_:/-]+)\s+a\s+skos:ConceptScheme', first_line)
-            if m:
-                scheme_subject = m.group(1)
+            # Whitespace-normalized header line split at the type declaration, no regex involved
+            first_line = ' '.join(self.concept_scheme.split('\n', 1)[0].split())
+            subject, sep, _ = first_line.partition(' a skos:ConceptScheme')
+            if sep and self._is_scheme_subject(subject):
+                scheme_subject = subject
                 # Extract inner value and normalize using _clean_uri for robust comparisons
                 if scheme_subject.startswith('<') and scheme_subject.endswith('>'):
                     scheme_subject_inner = scheme_subject[1:-1]
                 else:
                     scheme_subject_inner = scheme_subject
-                scheme_subject_bare = self._clean_uri(scheme_subject_inner)
-                # Prepare both raw and normalized tokens for membership checks in inScheme
+                scheme_subject_bare = clean_uri(scheme_subject_inner)
+                # Raw token for readable reports
                 scheme_subject_raw_token = f"<{scheme_subject_inner}>"
-                scheme_subject_norm_token = f"<{scheme_subject_bare}>"
             else:
                 scheme_subject_bare = None
                 scheme_subject_raw_token = None
-                scheme_subject_norm_token = None
             
-            # Find hasTopConcept targets
-            targets = re.findall(r'skos:hasTopConcept\s+<([^>]+)>', self.concept_scheme)
-            for target in targets:
-                # Normalize target to bare absolute URI for comparison with concept_uris
-                raw_target_inner = target.strip()
-                target_bare = self._clean_uri(raw_target_inner)
+            # hasTopConcept targets, normalized to bare absolute URIs for comparison with
+            # concept_uris; deduplicated in document order so repeats are checked once
+            targets = dict.fromkeys(
+                clean_uri(m.group(1)) for m in _RE_HAS_TOP_CONCEPT.finditer(self.concept_scheme)
+            )
+            for target_bare in targets:
                 # Target must be a known Concept
                 if target_bare not in concept_uris:
                     violations.append(f"hasTopConcept points to non-Concept: <{target_bare}>")
                     continue
                 # Target concept must have inScheme = scheme_subject
-                if scheme_subject_bare:
-                    # Accept either the raw or normalized token depending on how it appears in concept properties
-                    expected_tokens = set()
-                    if scheme_subject_raw_token:
-                        expected_tokens.add(scheme_subject_raw_token)
-                    if scheme_subject_norm_token:
-                        expected_tokens.add(scheme_subject_norm_token)
-                    target_in_schemes = in_scheme.get(target_bare, set())
-                    if expected_tokens and not (target_in_schemes & expected_tokens):
-                        # Prefer reporting using the raw token for readability
-                        report_token = scheme_subject_raw_token or scheme_subject_norm_token
-                        violations.append(
-                            f"Concept <{target_bare}> is hasTopConcept of {report_token} but missing inScheme {report_token}"
-                        )
+                if scheme_subject_bare and scheme_subject_bare not in in_scheme.get(target_bare, ()):
+                    violations.append(
+                        f"Concept <{target_bare}> is hasTopConcept of {scheme_subject_raw_token} "
+                        f"but missing inScheme {scheme_subject_raw_token}"
+                    )
         
         return violations, warnings
 
-    def _apply_hierarchy_autofix(self, concepts: List[Dict]) -> int:
+    def _is_scheme_subject(self, subject: str) -> bool:
+        """Check the shape of a ConceptScheme subject: <IRI> or a prefixed name like 'ex:scheme'."""
+        if subject.startswith('<'):
+            return len(subject) > 2 and subject.endswith('>') and '>' not in subject[1:-1]
+        return bool(subject) and _SCHEME_SUBJECT_CHARS.issuperset(subject)
+
+    def _apply_hierarchy_autofix(self, concepts: List[Concept], index: Optional[Dict] = None) -> int:
         """Autofix: For concepts whose local IDs end with a code token (digits and optional
         hyphen-separated segments, e.g., '42-10', '311'), ensure they have a skos:broader to
         the nearest existing prefix parent concept (based on segment-aware prefixes).
         Adds the missing 'skos:broader <parent>' triple as needed.
+        Uses the code maps of the shared validation indexes (built if not passed) and records the
+        added links in them, so the same index can be reused for validation afterwards.
         Returns the number of broader links added.
         """
         added = 0
-        # Build maps code <-> uri
-        code_to_uri: Dict[str, str] = {}
-        uri_to_code: Dict[str, str] = {}
-        for c in concepts:
-            uri = c.get('uri', '')
-            code = self._extract_numeric_code(uri)
-            if code:
-                code_to_uri[code] = uri
-                uri_to_code[uri] = code
+        if index is None:
+            index = self._build_validation_indexes(concepts)
+        code_to_uri: Dict[str, str] = index['code_to_uri']
+        uri_to_code: Dict[str, str] = index['uri_to_code']
 
         if not code_to_uri:
             return 0
 
-        all_codes = set(code_to_uri.keys())
+        all_codes = frozenset(code_to_uri)
 
-        # Build current broader map (by codes)
-        broader_map: Dict[str, Set[str]] = defaultdict(set)
-        for c in concepts:
-            src_uri = c.get('uri', '')
-            src_code = uri_to_code.get(src_uri)
-            if not src_code:
-                continue
-            for prop in c.get('other_properties', []):
-                if 'skos:broader ' in prop:
-                    tgt_uris = getattr(self, '_extract_uris_from_property', lambda p: [self._extract_uri_from_property(p)] if self._extract_uri_from_property(p) else [])(prop)
-                    for tgt_uri_like in tgt_uris:
-                        tgt_code = self._extract_numeric_code(tgt_uri_like or '')
-                        if tgt_code:
-                            broader_map[src_code].add(tgt_code)
+        # Current broader map (by codes)
+        broader_map: Dict[str, Set[str]] = index['broader_codes']
+        # Links added below; applied to the index after the pass so all checks see the input state
+        added_links: List[Tuple[str, str, str, str]] = []
 
         # For each concept, add broader to the longest existing prefix if none of the prefixes is referenced
         for c in concepts:
-            uri = c.get('uri', '')
+            uri = c.uri
             code = uri_to_code.get(uri)
             # Determine valid parent prefixes for this code
-            prefixes = self._code_prefixes(code) if code else []
+            prefixes = self._code_prefixes(code)
             if not code or not prefixes:
                 continue
 
-            # Collect existing prefix candidates that actually exist as concepts
-            candidates = [p for p in prefixes if p in all_codes]
-            if not candidates:
+            # Prefixes are ordered longest first: the first existing one is the immediate parent
+            existing_prefixes = [p for p in prefixes if p in all_codes]
+            if not existing_prefixes:
                 # No existing prefix concepts to link to
                 continue
-            existing_broader_codes = broader_map.get(code, set())
-            # If any prefix already referenced, skip
-            if existing_broader_codes & set(candidates):
+            parent_code = existing_prefixes[0]
+            existing_broader_codes = broader_map.get(code)
+            # If any existing prefix concept is already referenced, skip
+            if existing_broader_codes and not existing_broader_codes.isdisjoint(existing_prefixes):
                 continue
 
-            # Choose the longest existing prefix as the immediate parent to link to
-            parent_code = max(candidates, key=len)
             parent_uri = code_to_uri[parent_code]
-            triple = f"skos:broader <{parent_uri.strip('<>')}>"
+            parent_token = f"<{_strip_angles(parent_uri)}>"
+            triple = f"skos:broader {parent_token}"
 
             # Avoid duplicates defensively
-            props = c.get('other_properties', [])
-            if triple not in props:
-                props.append(triple)
-                c['other_properties'] = props
+            if triple not in c.other_properties:
+                c.other_properties.append(triple)
+                added_links.append((uri, code, parent_code, parent_token))
                 added += 1
                 self.change_log.append(
-                    f"Autofix: added skos:broader <{parent_uri.strip('<>')}> to <{uri}> based on code {code}"
+                    f"Autofix: added skos:broader {parent_token} to <{uri}> based on code {code}"
                 )
 
+        # Keep the index in sync with the added triples
+        for uri, code, parent_code, parent_token in added_links:
+            index['broader_by_uri'].setdefault(uri, []).append(sys.intern(parent_token))
+            broader_map[code].add(parent_code)
+
         return added
     
-    def _validate_semantic_relations(self, concepts: List[Dict]) -> Tuple[List[str], List[str]]:
+    def _validate_semantic_relations(self, concepts: List[Concept], index: Optional[Dict] = None) -> Tuple[List[str], List[str]]:
         """Validate semantic relations for SKOS compliance - simplified to avoid iteration errors."""
         violations = []
         warnings = []
         
         # Simplified validation to avoid dictionary iteration issues
         # Just check for basic semantic relation conflicts without complex transitive closure
-        broader_relations = []
-        related_relations = []
-        
-        for concept in concepts:
-            uri = concept.get('uri', '')
-            other_props = concept.get('other_properties', [])
-            
-            for prop in other_props:
-                if 'skos:broader ' in prop:
-                    targets = getattr(self, '_extract_uris_from_property', lambda p: [self._extract_uri_from_property(p)] if self._extract_uri_from_property(p) else [])(prop)
-                    for target in targets:
-                        if target:
-                            broader_relations.append((uri, target))
-                elif 'skos:related ' in prop:
-                    targets = getattr(self, '_extract_uris_from_property', lambda p: [self._extract_uri_from_property(p)] if self._extract_uri_from_property(p) else [])(prop)
-                    for target in targets:
-                        if target:
-                            related_relations.append((uri, target))
+        if index is None:
+            index = self._build_validation_indexes(concepts)
+        # Both checks need broader links; vocabularies without hierarchy stop here
+        if not index['broader_by_uri']:
+            return violations, warnings
+        # Ordered (deduplicated) broader pairs keep the report order stable
+        broader_set = dict.fromkeys(
+            (uri, t) for uri, targets in index['broader_by_uri'].items() for t in targets
+        )
+        related_set = {(uri, t) for uri, targets in index['related_by_uri'].items() for t in targets}
         
         # Simple check: if same concepts are both broader and related, that's a violation
-        broader_set = set(broader_relations)
-        related_set = set(related_relations)
-        
-        direct_conflicts = broader_set & related_set
-        for conflict in direct_conflicts:
-            violations.append(
-                f"S27 Violation: <{conflict[0]}> has both skos:broader and skos:related to <{conflict[1]}>. "
-                f"Suggestion: Use either broader or related, but not both for the same concept pair."
-            )
+        if not related_set.isdisjoint(broader_set):
+            for conflict in broader_set:
+                if conflict in related_set:
+                    violations.append(
+                        f"S27 Violation: <{conflict[0]}> has both skos:broader and skos:related to <{conflict[1]}>. "
+                        f"Suggestion: Use either broader or related, but not both for the same concept pair."
+                    )
         
-        # Basic cycle detection without complex graph traversal
-        for source, target in broader_relations:
+        # Basic cycle detection without complex graph traversal; each pair is reported once
+        for source, target in broader_set:
             # Check if target also has source as broader (simple 2-node cycle)
-            if (target, source) in broader_set:
+            if source <= target and (target, source) in broader_set:
                 warnings.append(
                     f"Simple cycle detected: <{source}> and <{target}> are mutually broader. "
                     f"Suggestion: Remove one of the broader relations to create a proper hierarchy."
@@ -920,21 +1554,21 @@ class TTLCleaner:
         
         return violations, warnings
     
-    def _validate_datatypes_and_uris(self, concepts: List[Dict]) -> Tuple[List[str], List[str]]:
+    def _validate_datatypes_and_uris(self, concepts: List[Concept]) -> Tuple[List[str], List[str]]:
         """Validate URIs and datatypes."""
         violations = []
         warnings = []
         
         for concept in concepts:
             # Check URI format
-            if not self._is_valid_uri(concept['uri']):
-                violations.append(f"Invalid URI format: {concept['uri']}")
+            if not self._is_valid_uri(concept.uri):
+                violations.append(f"Invalid URI format: {concept.uri}")
             
             # Check language tags (basic BCP47 validation)
-            for label in concept['prefLabels'] + concept['altLabels']:
+            for label in chain(concept.prefLabels, concept.altLabels):
                 if label['lang'] and not self._is_valid_language_tag(label['lang']):
                     warnings.append(
-                        f"Potentially invalid language tag '{label['lang']}' in {concept['uri']}"
+                        f"Potentially invalid language tag '{label['lang']}' in {concept.uri}"
                     )
         
         return violations, warnings
@@ -946,53 +1580,21 @@ class TTLCleaner:
         """
         if not uri_or_token:
             return None
-        s = uri_or_token.strip()
-        # If enclosed in angle brackets, strip them
-        if s.startswith('<') and s.endswith('>'):
-            s = s[1:-1]
-        # If full URI, take last path segment
-        if '/' in s:
-            s = s.rstrip('/').split('/')[-1]
-        # Now extract trailing token: digits with optional hyphen-separated segments
-        m = re.search(r'(\d+(?:-\d+)*)$', s)
-        return m.group(1) if m else None
-
-    def _code_prefixes(self, code: Optional[str]) -> List[str]:
+        return _extract_numeric_code_cached(uri_or_token)
+
+    def _code_prefixes(self, code: Optional[str]) -> Tuple[str, ...]:
         """Return valid parent code prefixes for a given code token.
         Segment-aware:
-        - For hyphenated codes like '44-1-2' -> ['44-1', '44']
-        - For hyphenated two-level like '42-10' -> ['42', '4'] (include higher digit-only fallback)
-        - For plain digits like '311' -> ['31', '3']
-        Excludes the code itself.
+        - For hyphenated codes like '44-1-2' -> ('44-1', '44')
+        - For hyphenated two-level like '42-10' -> ('42', '4') (include higher digit-only fallback)
+        - For plain digits like '311' -> ('31', '3')
+        Excludes the code itself. Ordered from longest to shortest (memoized, shared tuple).
         """
         if not code:
-            return []
-        prefixes: List[str] = []
-        if '-' in code:
-            parts = code.split('-')
-            # Build segment-based prefixes, excluding the full code
-            for i in range(len(parts) - 1, 0, -1):
-                prefixes.append('-'.join(parts[:i]))
-            # Also include numeric fallbacks from the first segment (e.g., '42' -> '4')
-            first = parts[0]
-            if first.isdigit() and len(first) > 1:
-                for k in range(len(first) - 1, 0, -1):
-                    prefixes.append(first[:k])
-        else:
-            # Plain digits: progressively shorter prefixes
-            if code.isdigit() and len(code) > 1:
-                for k in range(len(code) - 1, 0, -1):
-                    prefixes.append(code[:k])
-        # Keep order from longest to shortest, de-duplicated while preserving order
-        seen = set()
-        result: List[str] = []
-        for p in prefixes:
-            if p not in seen:
-                seen.add(p)
-                result.append(p)
-        return result
+            return ()
+        return _code_prefixes_cached(code)
     
-    def _validate_hierarchy_gaps(self, concepts: List[Dict]) -> Tuple[List[str], List[str]]:
+    def _validate_hierarchy_gaps(self, concepts: List[Concept], index: Optional[Dict] = None) -> Tuple[List[str], List[str]]:
         """Detect missing intermediate hierarchical levels based on code tokens and
         check broader/narrower consistency with expected parents derived from the code.
         
@@ -1008,41 +1610,18 @@ class TTLCleaner:
         warnings: List[str] = []
         infos: List[str] = []
         
-        # Build maps code <-> uri
-        code_to_uri: Dict[str, str] = {}
-        uri_to_code: Dict[str, str] = {}
-        for c in concepts:
-            uri = c.get('uri', '')
-            code = self._extract_numeric_code(uri)
-            if code:
-                code_to_uri[code] = uri
-                uri_to_code[uri] = code
-        all_codes = set(code_to_uri.keys())
+        # Code map from the shared validation indexes
+        if index is None:
+            index = self._build_validation_indexes(concepts)
+        code_to_uri: Dict[str, str] = index['code_to_uri']
+        all_codes = frozenset(code_to_uri)
         
         if not all_codes:
             return violations, warnings
         
-        # Build broader and narrower maps using codes
-        broader_map: Dict[str, Set[str]] = defaultdict(set)
-        narrower_map: Dict[str, Set[str]] = defaultdict(set)
-        for c in concepts:
-            src_uri = c.get('uri', '')
-            src_code = uri_to_code.get(src_uri)
-            if not src_code:
-                continue
-            for prop in c.get('other_properties', []):
-                if 'skos:broader ' in prop:
-                    tgt_uris = self._extract_uris_from_property(prop)
-                    for tgt_uri_like in tgt_uris:
-                        tgt_code = self._extract_numeric_code(tgt_uri_like or '')
-                        if tgt_code:
-                            broader_map[src_code].add(tgt_code)
-                elif 'skos:narrower ' in prop:
-                    tgt_uris = self._extract_uris_from_property(prop)
-                    for tgt_uri_like in tgt_uris:
-                        tgt_code = self._extract_numeric_code(tgt_uri_like or '')
-                        if tgt_code:
-                            narrower_map[src_code].add(tgt_code)
+        # Broader and narrower maps using codes
+        broader_map: Dict[str, Set[str]] = index['broader_codes']
+        narrower_map: Dict[str, Set[str]] = index['narrower_codes']
         
         # Check for missing intermediate levels and broader/narrower consistency
         for code, uri in code_to_uri.items():
@@ -1086,7 +1665,7 @@ class TTLCleaner:
     def _extract_uri_from_property(self, prop: str) -> Optional[str]:
         """Extract URI from a property string like 'skos:broader <uri>'."""
         # Match URIs in angle brackets
-        match = re.search(r'<([^>]+)>', prop)
+        match = _RE_URI_ANGLE.search(prop)
         if match:
             return f"<{match.group(1)}>"
         return None
@@ -1097,70 +1676,123 @@ class TTLCleaner:
         """
         if not prop:
             return []
-        return [f"<{u}>" for u in re.findall(r'<([^>]+)>', prop)]
+        return [f"<{u}>" for u in _RE_URI_ANGLE.findall(prop)]
     
     def _compute_transitive_closure(self, relations: Set[Tuple[str, str]]) -> Set[Tuple[str, str]]:
-        """Compute transitive closure of relations - fixed to prevent dictionary iteration errors."""
-        closure = set(relations)
-        changed = True
-        
-        while changed:
-            changed = False
-            new_relations = set()
-            
-            # Create a copy of closure to iterate over to avoid "dictionary changed size during iteration"
-            closure_copy = set(closure)
-            
-            for (a, b) in closure_copy:
-                for (c, d) in closure_copy:
-                    if b == c and (a, d) not in closure:
-                        new_relations.add((a, d))
-                        changed = True
-            
-            closure.update(new_relations)
+        """Compute transitive closure of relations.
+        Builds an adjacency map once and walks it from every source (iterative DFS), so each
+        source costs O(V + E) instead of rescanning all pairs of pairs until nothing changes.
+        """
+        adjacency: Dict[str, Set[str]] = defaultdict(set)
+        for source, target in relations:
+            adjacency[source].add(target)
+        
+        closure = set()
+        for source, targets in adjacency.items():
+            reachable = set()
+            stack = list(targets)
+            while stack:
+                node = stack.pop()
+                if node in reachable:
+                    continue
+                reachable.add(node)
+                next_nodes = adjacency.get(node)
+                if next_nodes:
+                    stack.extend(next_nodes - reachable)
+            closure.update((source, target) for target in reachable)
         
         return closure
     
     def _detect_cycles(self, relations: Set[Tuple[str, str]]) -> List[List[str]]:
-        """Detect cycles in directed graph of relations."""
+        """Detect cycles in directed graph of relations.
+        Uses an iterative Tarjan SCC pass (no recursion, linear time). For every strongly
+        connected component with more than one node, or a node with a self-loop, one cycle is
+        returned as a node path that starts and ends with the same node, e.g. [a, b, a].
+        """
         # Build adjacency list
         graph = defaultdict(list)
         for source, target in relations:
             graph[source].append(target)
         
-        cycles = []
-        visited = set()
-        rec_stack = set()
-        
-        def dfs(node, path):
-            if node in rec_stack:
-                # Found cycle
-                cycle_start = path.index(node)
-                cycles.append(path[cycle_start:] + [node])
-                return
-            
-            if node in visited:
-                return
-            
-            visited.add(node)
-            rec_stack.add(node)
-            
-            for neighbor in graph[node]:
-                dfs(neighbor, path + [neighbor])
-            
-            rec_stack.remove(node)
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        scc_stack: List[str] = []
+        on_stack: Set[str] = set()
+        components: List[List[str]] = []
         
-        for node in graph:
-            if node not in visited:
-                dfs(node, [node])
+        for root in list(graph):
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            scc_stack.append(root)
+            on_stack.add(root)
+            work_stack = [(root, iter(graph.get(root, ())))]
+            while work_stack:
+                node, neighbors = work_stack[-1]
+                for neighbor in neighbors:
+                    if neighbor not in index:
+                        index[neighbor] = lowlink[neighbor] = len(index)
+                        scc_stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work_stack.append((neighbor, iter(graph.get(neighbor, ()))))
+                        break
+                    if neighbor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[neighbor])
+                else:
+                    # All neighbors done: close the frame and propagate lowlink to the parent
+                    work_stack.pop()
+                    if work_stack:
+                        parent = work_stack[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = scc_stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+        
+        cycles = []
+        for component in components:
+            start = component[-1]
+            if len(component) == 1:
+                if start in graph.get(start, ()):
+                    cycles.append([start, start])
+                continue
+            # Shortest path back to start inside the component (BFS) gives a concrete cycle
+            members = set(component)
+            parents = {}
+            queue = [start]
+            for node in queue:
+                if start in parents:
+                    break
+                for neighbor in graph.get(node, ()):
+                    if neighbor in members and neighbor not in parents:
+                        parents[neighbor] = node
+                        queue.append(neighbor)
+            # Walk the parent links backwards from start, then reverse into edge order
+            path = [start]
+            node = parents[start]
+            while node != start:
+                path.append(node)
+                node = parents[node]
+            path.append(start)
+            path.reverse()
+            cycles.append(path)
         
         return cycles
     
     def _is_valid_uri(self, uri: str) -> bool:
-        """Basic URI validation."""
+        """Basic URI validation: the URI needs a scheme and a network location (authority)."""
         try:
             # Remove angle brackets if present
-            clean_uri = uri.strip('<>')
+            clean_uri = _strip_angles(uri)
+            # Fast path for the common http(s) URI with a plain authority; anything else
+            # (other schemes, brackets, control characters) is decided by urlparse
+            if _RE_HTTP_AUTHORITY.match(clean_uri):
+                return True
             result = urllib.parse.urlparse(clean_uri)
             return bool(result.scheme and result.netloc)
         except:
@@ -1171,99 +1803,50 @@ class TTLCleaner:
         if not tag:
             return False
         # Basic pattern: 2-3 letter language code, optionally followed by subtags
-        pattern = r'^[a-z]{2,3}(-[A-Za-z0-9]{1,8})*$'
-        return bool(re.match(pattern, tag))
+        return bool(_RE_LANG_TAG.match(tag))
     
     def _generate_validation_report(self, violations: List[str], warnings: List[str], infos: Optional[List[str]] = None) -> str:
         """Generate detailed validation report."""
-        report = []
-        report.append("\n" + "="*60)
-        report.append("SKOS VALIDATION REPORT")
-        report.append("="*60)
+        report = ["\n" + _REPORT_RULE, "SKOS VALIDATION REPORT", _REPORT_RULE]
         
         # Always include summary by check (even if all zeros)
         infos = infos or []
         summary = self._summarize_validation_counts(violations, warnings, infos)
         report.append("\nSUMMARY BY CHECK:")
-        for name, count in summary.items():
-            report.append(f"- {name}: {count}")
+        report.extend(f"- {name}: {count}" for name, count in summary.items())
         
-        if violations:
-            report.append(f"\nINTEGRITY VIOLATIONS ({len(violations)}):")
-            for i, violation in enumerate(violations, 1):
-                report.append(f"  {i:3d}. {violation}")
-        
-        if warnings:
-            report.append(f"\nWARNINGS ({len(warnings)}):")
-            for i, warning in enumerate(warnings, 1):
-                report.append(f"  {i:3d}. {warning}")
-        
-        if infos:
-            report.append(f"\nINFOS ({len(infos)}):")
-            for i, info in enumerate(infos, 1):
-                report.append(f"  {i:3d}. {info}")
+        # Numbered findings per section, added with one extend per section
+        for title, messages in (("INTEGRITY VIOLATIONS", violations), ("WARNINGS", warnings), ("INFOS", infos)):
+            if messages:
+                report.append(f"\n{title} ({len(messages)}):")
+                report.extend(f"  {i:3d}. {message}" for i, message in enumerate(messages, 1))
         
         if not violations and not warnings and not infos:
             report.append("\n✅ All SKOS integrity conditions satisfied!")
         
-        report.append("\n" + "="*60)
+        report.append("\n" + _REPORT_RULE)
         return "\n".join(report)
 
     def _summarize_validation_counts(self, violations: List[str], warnings: List[str], infos: Optional[List[str]] = None) -> Dict[str, int]:
-        """Summarize counts per known check category. Always returns all categories with zero when absent."""
-        categories = [
-            ("S14 prefLabel duplicates", lambda s: s.startswith("S14 Violation")),
-            ("S13 pref/alt overlap", lambda s: s.startswith("S13 Violation")),
-            ("URI format invalid", lambda s: s.startswith("Invalid URI format")),
-            ("Language tag possibly invalid", lambda s: "Potentially invalid language tag" in s),
-            ("S27 broader+related conflict", lambda s: s.startswith("S27 Violation")),
-            ("Simple hierarchy cycles", lambda s: s.startswith("Simple cycle detected")),
-            ("Hierarchy gap (missing intermediate level)", lambda s: s.startswith("Hierarchy gap")),
-            ("Hierarchy: missing broader to prefix", lambda s: s.startswith("Inconsistent hierarchy")),
-            ("Hierarchy: parent missing narrower", lambda s: s.startswith("Parent missing skos:narrower")),
-            ("Scheme: topConceptOf without inScheme", lambda s: "has topConceptOf" in s and "missing inScheme" in s),
-            ("Scheme: hasTopConcept -> non-Concept", lambda s: "hasTopConcept points to non-Concept" in s),
-            ("Scheme: hasTopConcept target missing inScheme", lambda s: "is hasTopConcept of" in s and "missing inScheme" in s),
-            ("Label warning: very long", lambda s: s.startswith("Very long label")),
-            ("Label warning: empty", lambda s: s.startswith("Empty label")),
-            ("Label warning: encoding issue", lambda s: s.startswith("Potential encoding issue")),
-            ("Label warning: looks like URI", lambda s: s.startswith("Label looks like URI")),
-        ]
-        infos = infos or []
-        all_msgs = list(violations) + list(warnings) + list(infos)
-        summary: Dict[str, int] = {}
-        for name, predicate in categories:
-            summary[name] = sum(1 for msg in all_msgs if predicate(msg))
+        """Summarize counts per known check category. Always returns all categories with zero when absent.
+        Each message is categorized in one pass: a single anchored match against all known
+        message prefixes, with the two concept-level scheme findings told apart by their wording.
+        """
+        summary: Dict[str, int] = dict.fromkeys((name for name, _ in _SUMMARY_CATEGORIES), 0)
+        for msg in chain(violations, warnings, infos or ()):
+            m = _RE_SUMMARY_PREFIX.match(msg)
+            if m:
+                summary[_SUMMARY_BY_PREFIX[m.group()]] += 1
+            elif "missing inScheme" in msg:
+                if "has topConceptOf" in msg:
+                    summary["Scheme: topConceptOf without inScheme"] += 1
+                if "is hasTopConcept of" in msg:
+                    summary["Scheme: hasTopConcept target missing inScheme"] += 1
         return summary
     
     def _clean_uri(self, uri: str) -> str:
         """Clean and normalize URI."""
-        uri = uri.strip()
-        
-        # Remove angle brackets if present
-        if uri.startswith('<') and uri.endswith('>'):
-            uri = uri[1:-1]
-        
-        # If URI doesn't start with http, it might be relative to @base
-        if not uri.startswith('http'):
-            if self.base_uri and not ':' in uri:
-                # Relative URI - combine with @base
-                uri = f"{self.base_uri.rstrip('/')}/{uri}"
-            elif ':' in uri:
-                # Prefixed URI like esco:123
-                prefix, local = uri.split(':', 1)
-                if prefix == 'esco':
-                    uri = f"http://data.europa.eu/esco/skill/{local}"
-                else:
-                    uri = f"http://example.org/{prefix}/{local}"
-            else:
-                # Plain ID, use @base if available, otherwise default ESCO prefix
-                if self.base_uri:
-                    uri = f"{self.base_uri.rstrip('/')}/{uri}"
-                else:
-                    uri = f"http://data.europa.eu/esco/skill/{uri}"
-        
-        return uri
+        return _clean_uri_cached(uri, self.base_uri)
 
     def _classify_uri_change(self, raw_uri: str, cleaned_uri: str) -> Tuple[bool, str]:
         """Determine whether a URI change is a real fix or just normalization.
@@ -1285,7 +1868,7 @@ class TTLCleaner:
         # If resolving with @base yields the same absolute URI we computed, and
         # the final output will be rendered as the same relative token again, suppress logging (treat as no-op).
         if self.base_uri and (not raw_inner.startswith('http')) and (':' not in raw_inner):
-            expected_abs = f"{self.base_uri.rstrip('/')}/{raw_inner.strip('<>')}"
+            expected_abs = f"{self.base_uri.rstrip('/')}/{raw_inner}"
             if expected_abs == cleaned_uri:
                 # No effective change for the final TTL (will be rendered as <relative> again)
                 return (False, "")
@@ -1311,6 +1894,15 @@ class TTLCleaner:
         # No change
         return (False, "")
     
+    def _log_text_change(self, kind: str, old: str, new: str) -> None:
+        """Add a change log entry for a label/text field fix (both sides truncated to 120 chars).
+        With verbose_changelog (or collect_change_log) off, only the number of such changes is kept.
+        """
+        if not (self.verbose_changelog and self.collect_change_log):
+            self._unlogged_changes += 1
+            return
+        self.change_log.append(f"{kind}: '{_log_excerpt(old)}' -> '{_log_excerpt(new)}'")
+    
     def _clean_label(self, label: str) -> Optional[str]:
         """Clean label text."""
         if not label:
@@ -1319,40 +1911,19 @@ class TTLCleaner:
         # Fix encoding issues
         original_label = label
         
-        # Common encoding fixes
-        replacements = {
-            'Ã¤': 'ä', 'Ã¶': 'ö', 'Ã¼': 'ü',
-            'Ã„': 'Ä', 'Ã–': 'Ö', 'Ãœ': 'Ü',
-            'ÃŸ': 'ß', 'Ã©': 'é', 'Ã¨': 'è',
-            'Ã¡': 'á', 'Ã ': 'à', 'Ã³': 'ó',
-            'Ã²': 'ò', 'Ãº': 'ú', 'Ã¹': 'ù'
-        }
-        
-        for wrong, correct in replacements.items():
-            label = label.replace(wrong, correct)
+        # Common encoding fixes (one scan; skipped for the usual clean label)
+        if 'Ã' in label:
+            label = _RE_ENCODING_FIXES.sub(_replace_encoding_fix, label)
         
         if label != original_label:
             self.stats['encoding_issues_fixed'] += 1
-            # Log label cleaning (truncate to avoid overly long lines)
-            old = original_label.strip()
-            new = label.strip()
-            if len(old) > 120:
-                old = old[:117] + '...'
-            if len(new) > 120:
-                new = new[:117] + '...'
-            self.change_log.append(f"Label cleaned: '{old}' -> '{new}'")
+            self._log_text_change("Label cleaned", original_label, label)
         
         # Remove extra whitespace (log when whitespace-only normalization happens)
         before_ws = label
         label = ' '.join(label.split())
         if label != before_ws and before_ws == original_label:
-            old = before_ws.strip()
-            new = label.strip()
-            if len(old) > 120:
-                old = old[:117] + '...'
-            if len(new) > 120:
-                new = new[:117] + '...'
-            self.change_log.append(f"Label normalized (whitespace): '{old}' -> '{new}'")
+            self._log_text_change("Label normalized (whitespace)", before_ws, label)
         
         # Remove empty labels
         if not label.strip():
@@ -1368,57 +1939,19 @@ class TTLCleaner:
         
         original_text = text
         
-        # Fix encoding issues (same as labels)
-        replacements = {
-            'Ã¤': 'ä', 'Ã¶': 'ö', 'Ã¼': 'ü',
-            'Ã„': 'Ä', 'Ã–': 'Ö', 'Ãœ': 'Ü',
-            'ÃŸ': 'ß', 'Ã©': 'é', 'Ã¨': 'è',
-            'Ã¡': 'á', 'Ã ': 'à', 'Ã³': 'ó',
-            'Ã²': 'ò', 'Ãº': 'ú', 'Ã¹': 'ù',
-            '&nbsp;': ' ', '&amp;': '&', '&lt;': '<', '&gt;': '>',
-            '&quot;': '"', '&#39;': "'", '&apos;': "'"
-        }
+        # Fix encoding issues (same as labels), then decode HTML entities (named and numeric)
+        if 'Ã' in text:
+            text = _RE_ENCODING_FIXES.sub(_replace_encoding_fix, text)
+        if '&' in text:
+            text = _RE_HTML_ENTITY.sub(_replace_html_entity, text)
         
-        for wrong, correct in replacements.items():
-            text = text.replace(wrong, correct)
-        
-        # Fix spacing after punctuation
-        # Add space after commas if missing
-        text = re.sub(r',(?!\s)', ', ', text)
-        # Add space after periods if missing (but not in abbreviations)
-        text = re.sub(r'\.(?!\s|$|\d)', '. ', text)
-        # Add space after semicolons if missing
-        text = re.sub(r';(?!\s)', '; ', text)
-        # Add space after colons if missing, but preserve gender-colon forms and numeric ratios like 1:1
-        # Protect numeric ratios (e.g., 1:1, 10:30)
-        text = re.sub(r'(\d+):(\d+)', r'\1<NO_SPACE_COLON>\2', text)
-        # Protect German gender-colon forms (:in, :innen)
-        text = re.sub(r'(?i)([A-Za-zÄÖÜäöüß][\wÄÖÜäöüß-]*)\:(in|innen)\b', r'\1<NO_SPACE_COLON>\2', text)
-        # Now add space after remaining colons
-        text = re.sub(r':(?!\s|$)', ': ', text)
-        # Restore protected colons
-        text = text.replace('<NO_SPACE_COLON>', ':')
-        # Add space after exclamation marks if missing
-        text = re.sub(r'!(?!\s|$)', '! ', text)
-        # Add space after question marks if missing
-        text = re.sub(r'\?(?!\s|$)', '? ', text)
-        
-        # Remove multiple consecutive spaces
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove leading/trailing whitespace
-        text = text.strip()
+        # Fix spacing after punctuation and collapse whitespace
+        text = _normalize_punctuation_and_whitespace(text)
         
         # Track changes (count as text field cleaned)
         if text != original_text:
             self.stats['text_fields_cleaned'] += 1
-            old = original_text.strip()
-            new = text.strip()
-            if len(old) > 120:
-                old = old[:117] + '...'
-            if len(new) > 120:
-                new = new[:117] + '...'
-            self.change_log.append(f"Text field cleaned: '{old}' -> '{new}'")
+            self._log_text_change("Text field cleaned", original_text, text)
         
         # Remove empty text
         if not text.strip():
@@ -1434,66 +1967,25 @@ class TTLCleaner:
         
         original_text = text
         
-        # Fix spacing after punctuation - only add space if none exists
-        # Add space after commas if missing (negative lookahead for existing space)
-        text = re.sub(r',(?!\s)', ', ', text)
-        # Add space after periods if missing (but not in abbreviations or at end)
-        text = re.sub(r'\.(?!\s|$|\d)', '. ', text)
-        # Add space after semicolons if missing
-        text = re.sub(r';(?!\s)', '; ', text)
-        # Add space after colons if missing (but not at end), preserving gender-colon forms and numeric ratios
-        # Protect numeric ratios (e.g., 1:1, 10:30)
-        text = re.sub(r'(\d+):(\d+)', r'\1<NO_SPACE_COLON>\2', text)
-        # Protect German gender-colon forms (:in, :innen)
-        text = re.sub(r'(?i)([A-Za-zÄÖÜäöüß][\wÄÖÜäöüß-]*)\:(in|innen)\b', r'\1<NO_SPACE_COLON>\2', text)
-        # Now add space after remaining colons
-        text = re.sub(r':(?!\s|$)', ': ', text)
-        # Restore protected colons
-        text = text.replace('<NO_SPACE_COLON>', ':')
-        # Add space after exclamation marks if missing (but not at end)
-        text = re.sub(r'!(?!\s|$)', '! ', text)
-        # Add space after question marks if missing (but not at end)
-        text = re.sub(r'\?(?!\s|$)', '? ', text)
-        
-        # Remove multiple consecutive spaces (but preserve single spaces)
-        text = re.sub(r'\s{2,}', ' ', text)
-        
-        # Remove leading/trailing whitespace
-        text = text.strip()
+        # Fix spacing after punctuation - only add space if none exists - and collapse whitespace
+        text = _normalize_punctuation_and_whitespace(text)
         
         # Track comma fixes only if text actually changed
         if text != original_text:
             self.stats['comma_fixes'] += 1
             self.stats['text_fields_cleaned'] += 1
-            old = original_text.strip()
-            new = text.strip()
-            if len(old) > 120:
-                old = old[:117] + '...'
-            if len(new) > 120:
-                new = new[:117] + '...'
-            self.change_log.append(f"Comma spacing fixed: '{old}' -> '{new}'")
+            self._log_text_change("Comma spacing fixed", original_text, text)
         
         return text
     
-    def _clean_concepts(self, concepts: List[Dict]) -> List[Dict]:
+    def _clean_concepts(self, concepts: List[Concept]) -> List[Concept]:
         """Clean and deduplicate concepts."""
-        # Track URIs to find duplicates
-        uri_counts = Counter(concept['uri'] for concept in concepts if concept['uri'])
-        duplicates = {uri for uri, count in uri_counts.items() if count > 1}
-        
-        # Group concepts by URI
-        uri_groups = defaultdict(list)
-        for concept in concepts:
-            if concept['uri']:
-                uri_groups[concept['uri']].append(concept)
-        
-        cleaned_concepts = []
-        
+        # Keep the first concept per URI; one set lookup per concept
         seen_uris = set()
         unique_concepts = []
         
         for concept in concepts:
-            uri = concept['uri']
+            uri = concept.uri
             if uri not in seen_uris:
                 seen_uris.add(uri)
                 unique_concepts.append(concept)
@@ -1503,43 +1995,45 @@ class TTLCleaner:
         
         return unique_concepts
     
-    def _merge_duplicate_concepts(self, concepts: List[Dict]) -> Dict:
+    def _merge_duplicate_concepts(self, concepts: List[Concept]) -> Optional[Concept]:
         """Merge duplicate concepts into one."""
         if not concepts:
             return None
         
         # Use first concept as base
-        merged = concepts[0].copy()
-        merged['prefLabels'] = []
-        merged['altLabels'] = []
-        merged['issues'] = []
-        
-        # Collect all labels
-        all_pref_labels = set()
-        all_alt_labels = set()
+        merged = replace(concepts[0], prefLabels=[], altLabels=[], issues=[])
+        
+        # Collect all labels; dicts keyed by (text, lang) keep first-seen order, so the
+        # merged concept is written the same way on every run
+        all_pref_labels = {}
+        all_alt_labels = {}
         all_issues = set()
         
         for concept in concepts:
-            for label in concept['prefLabels']:
-                all_pref_labels.add((label['text'], label['lang']))
-            for label in concept['altLabels']:
-                all_alt_labels.add((label['text'], label['lang']))
-            all_issues.update(concept['issues'])
+            for label in concept.prefLabels:
+                all_pref_labels[(label['text'], label['lang'])] = None
+            for label in concept.altLabels:
+                all_alt_labels[(label['text'], label['lang'])] = None
+            all_issues.update(concept.issues)
         
         # Convert back to list format
-        merged['prefLabels'] = [{'text': text, 'lang': lang} for text, lang in all_pref_labels]
-        merged['altLabels'] = [{'text': text, 'lang': lang} for text, lang in all_alt_labels]
-        merged['issues'] = list(all_issues)
+        merged.prefLabels = [{'text': text, 'lang': lang} for text, lang in all_pref_labels]
+        merged.altLabels = [{'text': text, 'lang': lang} for text, lang in all_alt_labels]
+        merged.issues = list(all_issues)
         
         return merged
     
-    def _generate_cleaned_content(self, concepts: List[Dict], original_content: str) -> str:
+    def _generate_cleaned_content(self, concepts: List[Concept], original_content: str) -> str:
         """Generate cleaned TTL content as string."""
-        # Extract prefixes from original file
-        prefixes = []
-        for line in original_content.split('\n'):
-            if line.strip().startswith('@prefix'):
-                prefixes.append(line.strip())
+        return ''.join(self._iter_cleaned_content(concepts, original_content))
+    
+    def _iter_cleaned_content(self, concepts: List[Concept], original_content: str) -> Iterator[str]:
+        """Yield cleaned TTL content: the header (@base, prefixes, ConceptScheme), then the
+        concepts in fragments of up to OUTPUT_FRAGMENT_LINES lines. The fragments join to
+        the complete cleaned file.
+        """
+        # Extract prefixes from original file (one scan, no list of all lines)
+        prefixes = [m.group(1).rstrip() for m in _RE_PREFIX_LINE.finditer(original_content)]
         
         # Generate cleaned TTL content
         lines = []
@@ -1565,20 +2059,84 @@ class TTLCleaner:
             lines.append(self.concept_scheme)
             lines.append('')
         
-        # Add concepts
+        yield '\n'.join(lines)
+        
+        # Add concepts, each preceded by a blank line; the lines of many concepts are
+        # collected in one list and joined once per fragment
+        lines = []
         for concept in concepts:
-            lines.append(self._format_concept(concept))
             lines.append('')
-        
-        return '\n'.join(lines)
+            self._append_concept_lines(concept, lines)
+            if len(lines) >= OUTPUT_FRAGMENT_LINES:
+                lines.append('')
+                yield '\n'.join(lines)
+                lines.clear()
+        if lines:
+            lines.append('')
+            yield '\n'.join(lines)
     
-    def _write_cleaned_file(self, concepts: List[Dict], original_content: str, output_path: str, input_path: Optional[str] = None):
+    def _iter_ntriples(self, concepts: List[Concept], original_content: str) -> Iterator[str]:
+        """Yield the cleaned data as N-Triples, one triple with absolute IRIs per line: the
+        ConceptScheme first, then the concepts, in fragments of up to OUTPUT_FRAGMENT_LINES lines.
+        Literal values get the same comma spacing fix (and stats) as in Turtle output.
+        Properties the converter cannot expand (see _turtle_to_ntriples) are skipped with a warning.
+        """
+        # Prefix map from the original @prefix declarations (or the Turtle output defaults)
+        declarations = (_RE_PREFIX_DECL.match(m.group(1)) for m in _RE_PREFIX_LINE.finditer(original_content))
+        prefixes = dict(decl.groups('') for decl in declarations if decl) or dict(_DEFAULT_PREFIXES)
+        base_uri = self.base_uri
+        lines: List[str] = []
+
+        if self.concept_scheme:
+            m = _RE_TURTLE_TERM.match(self.concept_scheme)
+            subject = _nt_term(m, prefixes, base_uri) if m and (m.group('iri') is not None or m.group('name')) else None
+            triples = _turtle_to_ntriples(subject, self.concept_scheme[m.end():], prefixes, base_uri) if subject else None
+            if triples is None:
+                self.warnings.append("N-Triples output: skipped ConceptScheme block with unsupported Turtle syntax")
+            else:
+                lines.extend(triples)
+
+        fix = self._fix_comma_spacing
+        stats = self.stats
+        for concept in concepts:
+            # Resolve the subject token as written, so it matches relation objects that point to it;
+            # fall back to the cleaned URI for tokens that are no Turtle term (e.g. bare http://...)
+            subject = (concept.raw_uri and _nt_subject(concept.raw_uri, prefixes, base_uri)) or f'<{concept.uri}>'
+            lines.append(f'{subject} {_NT_RDF_TYPE} {_NT_SKOS_CONCEPT} .')
+            for attr, _, counter in _LITERAL_OUTPUT:
+                values = getattr(concept, attr)
+                if not values:
+                    continue
+                predicate = _NT_LITERAL_PREDICATES[attr]
+                for value in values:
+                    lang = value['lang']
+                    if lang:
+                        lines.append(f'{subject} {predicate} "{_nt_literal(fix(value["text"]))}"@{lang} .')
+                    else:
+                        lines.append(f'{subject} {predicate} "{_nt_literal(fix(value["text"]))}" .')
+                if counter:
+                    stats[counter] += len(values)
+            for prop in concept.other_properties:
+                triples = _turtle_to_ntriples(subject, prop, prefixes, base_uri)
+                if triples is None:
+                    self.warnings.append(f"N-Triples output: skipped unsupported property of {subject}: {prop}")
+                else:
+                    lines.extend(triples)
+            if len(lines) >= OUTPUT_FRAGMENT_LINES:
+                lines.append('')
+                yield '\n'.join(lines)
+                lines.clear()
+        if lines:
+            lines.append('')
+            yield '\n'.join(lines)
+    
+    def _write_cleaned_file(self, concepts: List[Concept], original_content: str, output_path: Union[str, Path], input_path: Optional[Union[str, Path]] = None):
         """Write cleaned concepts to new TTL file.
         If preserve_byte_identity is enabled and no transformations occurred, copy original bytes to output.
         """
-        # Determine if we should passthrough original bytes
+        # Determine if we should passthrough original bytes (Turtle output only)
         do_passthrough = False
-        if getattr(self, 'preserve_byte_identity', False) and self._no_transformations_made():
+        if getattr(self, 'preserve_byte_identity', False) and self.output_format == 'ttl' and self._no_transformations_made():
             do_passthrough = True
 
         if do_passthrough and input_path:
@@ -1591,18 +2149,21 @@ class TTLCleaner:
                 print(f"[WARN] Passthrough failed ({e}), falling back to regenerated content")
                 # Fall back to regenerated content below
 
-        cleaned_content = self._generate_cleaned_content(concepts, original_content)
-
-        # Write regenerated content
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(cleaned_content)
+        # Stream the regenerated fragments (many concepts each) through a large buffer,
+        # without building the whole cleaned file as one string
+        if self.output_format == 'nt':
+            fragments = self._iter_ntriples(concepts, original_content)
+        else:
+            fragments = self._iter_cleaned_content(concepts, original_content)
+        with open(output_path, 'w', encoding='utf-8', buffering=STREAM_BUFFER_SIZE) as f:
+            f.writelines(fragments)
         
         print(f"[OK] Cleaned file saved: {output_path}")
 
     def _no_transformations_made(self) -> bool:
         """Return True if cleaning made no substantive changes that would affect bytes.
         We consider:
-          - No entries in change_log
+          - No entries in change_log (nor unlogged text changes)
           - No removals/fixes/normalizations/spacing fixes/text cleanups
           - No concepts dropped due to missing prefLabel
           - Autofix broader not applied
@@ -1620,13 +2181,13 @@ class TTLCleaner:
             self.stats.get('text_fields_cleaned', 0) == 0 and
             self.stats.get('concepts_without_preflabel', 0) == 0
         )
-        return zero_stats and not self.change_log
+        return zero_stats and not self.change_log and not self._unlogged_changes
     
-    def _write_change_log(self, log_path: str) -> None:
+    def _write_change_log(self, log_path: Union[str, Path]) -> None:
         """Write detailed change log to file."""
         from datetime import datetime
         
-        with open(log_path, 'w', encoding='utf-8') as f:
+        with open(log_path, 'w', encoding='utf-8', buffering=STREAM_BUFFER_SIZE) as f:
             f.write(f"TTL CLEANER CHANGE LOG\n")
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"="*60 + "\n\n")
@@ -1644,18 +2205,27 @@ class TTLCleaner:
             # Detailed changes
             f.write(f"DETAILED CHANGES:\n")
             f.write(f"-" * 40 + "\n")
-            for i, change in enumerate(self.change_log, 1):
-                f.write(f"{i:4d}. {change}\n")
-            if not self.change_log:
-                f.write("(No detailed change entries)\n")
+            self._write_change_entries(f)
                 
         print(f"[OK] Change log written: {log_path}")
     
-    def _write_validation_report(self, log_path: str, violations: List[str], warnings: List[str], infos: Optional[List[str]] = None) -> None:
+    def _write_change_entries(self, f) -> None:
+        """Write the numbered change log entries (or a placeholder if there are none) to f."""
+        if isinstance(self.change_log, _ChangeLogSpool):
+            self.change_log.write_to(f)
+        elif isinstance(self.change_log, _ChangeCounter):
+            if self.change_log:
+                f.write(f"({len(self.change_log)} entries counted, details not collected)\n")
+        else:
+            f.writelines(_numbered_lines(self.change_log))
+        if not self.change_log:
+            f.write("(No detailed change entries)\n")
+    
+    def _write_validation_report(self, log_path: Union[str, Path], violations: List[str], warnings: List[str], infos: Optional[List[str]] = None) -> None:
         """Write detailed validation report to file."""
         from datetime import datetime
         
-        with open(log_path, 'w', encoding='utf-8') as f:
+        with open(log_path, 'w', encoding='utf-8', buffering=STREAM_BUFFER_SIZE) as f:
             f.write(f"SKOS VALIDATION REPORT\n")
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"="*60 + "\n\n")
@@ -1677,24 +2247,21 @@ class TTLCleaner:
             if violations:
                 f.write(f"INTEGRITY VIOLATIONS ({len(violations)}):\n")
                 f.write(f"-" * 40 + "\n")
-                for i, violation in enumerate(violations, 1):
-                    f.write(f"{i:4d}. {violation}\n")
+                f.writelines(_numbered_lines(violations))
                 f.write(f"\n")
             
             # Warnings
             if warnings:
                 f.write(f"WARNINGS ({len(warnings)}):\n")
                 f.write(f"-" * 40 + "\n")
-                for i, warning in enumerate(warnings, 1):
-                    f.write(f"{i:4d}. {warning}\n")
+                f.writelines(_numbered_lines(warnings))
                 f.write(f"\n")
             
             # Infos
             if infos:
                 f.write(f"INFOS ({len(infos)}):\n")
                 f.write(f"-" * 40 + "\n")
-                for i, info in enumerate(infos, 1):
-                    f.write(f"{i:4d}. {info}\n")
+                f.writelines(_numbered_lines(infos))
                 f.write(f"\n")
             
             if not violations and not warnings and not infos:
@@ -1702,10 +2269,10 @@ class TTLCleaner:
                 
         print(f"[OK] Validation report written: {log_path}")
     
-    def _write_combined_report(self, log_path: str, input_path: str, output_path: str, violations: List[str], warnings: List[str], infos: Optional[List[str]] = None) -> None:
+    def _write_combined_report(self, log_path: Union[str, Path], input_path: Union[str, Path], output_path: Union[str, Path], violations: List[str], warnings: List[str], infos: Optional[List[str]] = None) -> None:
         """Write a single combined logfile with stats, errors, change log, and validation results."""
         from datetime import datetime
-        with open(log_path, 'w', encoding='utf-8') as f:
+        with open(log_path, 'w', encoding='utf-8', buffering=STREAM_BUFFER_SIZE) as f:
             f.write("TTL CLEANER FULL REPORT\n")
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write("="*60 + "\n\n")
@@ -1730,23 +2297,18 @@ class TTLCleaner:
             if self.errors:
                 f.write(f"ERRORS DURING CLEANING ({len(self.errors)}):\n")
                 f.write("-"*40 + "\n")
-                for i, err in enumerate(self.errors, 1):
-                    f.write(f"{i:4d}. {err}\n")
+                f.writelines(_numbered_lines(self.errors))
                 f.write("\n")
             if self.warnings:
                 f.write(f"WARNINGS DURING CLEANING ({len(self.warnings)}):\n")
                 f.write("-"*40 + "\n")
-                for i, warn in enumerate(self.warnings, 1):
-                    f.write(f"{i:4d}. {warn}\n")
+                f.writelines(_numbered_lines(self.warnings))
                 f.write("\n")
             
             # Change log
             f.write(f"CHANGE LOG ({len(self.change_log)} entries):\n")
             f.write("-"*40 + "\n")
-            for i, change in enumerate(self.change_log, 1):
-                f.write(f"{i:4d}. {change}\n")
-            if not self.change_log:
-                f.write("(No detailed change entries)\n")
+            self._write_change_entries(f)
             f.write("\n")
             
             # Validation
@@ -1764,27 +2326,24 @@ class TTLCleaner:
             if violations:
                 f.write(f"VIOLATIONS ({len(violations)}):\n")
                 f.write("-"*40 + "\n")
-                for i, v in enumerate(violations, 1):
-                    f.write(f"{i:4d}. {v}\n")
+                f.writelines(_numbered_lines(violations))
                 f.write("\n")
             if warnings:
                 f.write(f"WARNINGS ({len(warnings)}):\n")
                 f.write("-"*40 + "\n")
-                for i, w in enumerate(warnings, 1):
-                    f.write(f"{i:4d}. {w}\n")
+                f.writelines(_numbered_lines(warnings))
                 f.write("\n")
             if infos:
                 f.write(f"INFOS ({len(infos)}):\n")
                 f.write("-"*40 + "\n")
-                for i, info in enumerate(infos, 1):
-                    f.write(f"{i:4d}. {info}\n")
+                f.writelines(_numbered_lines(infos))
                 f.write("\n")
             if not violations and not warnings and not infos:
                 f.write("SUCCESS: All SKOS integrity conditions satisfied!\n")
         
         print(f"[OK] Full report written: {log_path}")
 
-    def _semantic_isomorphic_check(self, input_path: str, output_path: str) -> Tuple[bool, int, int]:
+    def _semantic_isomorphic_check(self, input_path: Union[str, Path], output_path: Union[str, Path]) -> Tuple[bool, int, int]:
         """Load input and output TTL with rdflib and check graph isomorphism.
         Returns tuple: (isomorphic, triples_input, triples_output).
         """
@@ -1799,7 +2358,7 @@ class TTLCleaner:
         g2.parse(output_path, format='turtle')
         return (g1.isomorphic(g2), len(g1), len(g2))
     
-    def _clean_concepts_chunked(self, concepts: List[Dict]) -> List[Dict]:
+    def _clean_concepts_chunked(self, concepts: List[Concept]) -> List[Concept]:
         """Clean concepts in chunks for memory efficiency."""
         cleaned_concepts = []
         total_chunks = (len(concepts) + self.chunk_size - 1) // self.chunk_size
@@ -1816,48 +2375,50 @@ class TTLCleaner:
             cleaned_chunk = self._clean_concepts(chunk)
             cleaned_concepts.extend(cleaned_chunk)
             
-            # Memory cleanup for large datasets
-            if self.memory_efficient:
-                import gc
+            # Memory cleanup for large datasets; a full collection walks every surviving
+            # concept, so it only runs every GC_COLLECT_INTERVAL chunks
+            if self.memory_efficient and self.processed_chunks % GC_COLLECT_INTERVAL == 0:
                 gc.collect()
         
         return cleaned_concepts
     
-    def _validate_concepts_chunked(self, concepts: List[Dict]) -> Tuple[List[str], List[str]]:
-        """Validate concepts in chunks for memory efficiency."""
+    def _validate_concepts_chunked(self, concepts: List[Concept], index: Optional[Dict] = None) -> Tuple[List[str], List[str]]:
+        """Validate concepts in chunks for memory efficiency.
+        The per-chunk validators are independent between chunks and run in worker processes
+        when parallel validation is enabled; results are merged in chunk order.
+        The global checks use the shared validation indexes (built here if not passed)."""
         all_violations = []
         all_warnings = []
         total_chunks = (len(concepts) + self.chunk_size - 1) // self.chunk_size
-        
-        print(f"[INFO] Validating {len(concepts)} concepts in {total_chunks} chunks")
-        
-        for i in range(0, len(concepts), self.chunk_size):
-            chunk = concepts[i:i + self.chunk_size]
-            chunk_num = (i // self.chunk_size) + 1
-            
-            print(f"[INFO] Validating chunk {chunk_num}/{total_chunks}...")
-            
-            # Validate this chunk
-            violations, warnings = self._validate_skos_integrity(chunk)
-            all_violations.extend(violations)
-            all_warnings.extend(warnings)
-            
-            violations, warnings = self._validate_semantic_relations(chunk)
-            all_violations.extend(violations)
-            all_warnings.extend(warnings)
-            
-            violations, warnings = self._validate_datatypes_and_uris(chunk)
-            all_violations.extend(violations)
-            all_warnings.extend(warnings)
+        chunks = (concepts[i:i + self.chunk_size] for i in range(0, len(concepts), self.chunk_size))
+        workers = min(total_chunks, os.cpu_count() or 1)
+        
+        if self.parallel and workers > 1 and len(concepts) >= PARALLEL_MIN_CONCEPTS:
+            print(f"[INFO] Validating {len(concepts)} concepts in {total_chunks} chunks ({workers} workers)")
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self, None, None)) as executor:
+                for chunk_num, (violations, warnings) in enumerate(executor.map(_validate_chunk_in_worker, chunks), 1):
+                    print(f"[INFO] Validated chunk {chunk_num}/{total_chunks}")
+                    all_violations.extend(violations)
+                    all_warnings.extend(warnings)
+        else:
+            print(f"[INFO] Validating {len(concepts)} concepts in {total_chunks} chunks")
             
-            # Memory cleanup
-            if self.memory_efficient:
-                import gc
-                gc.collect()
+            for chunk_num, chunk in enumerate(chunks, 1):
+                print(f"[INFO] Validating chunk {chunk_num}/{total_chunks}...")
+                
+                # Validate this chunk, collecting straight into the result lists
+                self._validate_chunk(chunk, all_violations, all_warnings)
+                
+                # Memory cleanup (every GC_COLLECT_INTERVAL chunks)
+                if self.memory_efficient and chunk_num % GC_COLLECT_INTERVAL == 0:
+                    gc.collect()
         # After per-chunk validations, run hierarchy gap validation across all concepts (needs global view)
+        if index is None:
+            index = self._build_validation_indexes(concepts)
         try:
             print("[INFO] Running global hierarchy validation across all chunks...")
-            violations, warnings = self._validate_hierarchy_gaps(concepts)
+            violations, warnings = self._validate_hierarchy_gaps(concepts, index)
             all_violations.extend(violations)
             all_warnings.extend(warnings)
         except Exception as e:
@@ -1867,7 +2428,7 @@ class TTLCleaner:
         # Also run scheme consistency validation across all concepts to mirror non-chunked path
         try:
             print("[INFO] Running scheme consistency validation across all chunks...")
-            violations, warnings = self._validate_scheme_consistency(concepts)
+            violations, warnings = self._validate_scheme_consistency(concepts, index)
             all_violations.extend(violations)
             all_warnings.extend(warnings)
         except Exception as e:
@@ -1876,7 +2437,22 @@ class TTLCleaner:
 
         return all_violations, all_warnings
     
-    def _validate_skos_xl_labels(self, concepts: List[Dict]) -> Tuple[List[str], List[str]]:
+    def _validate_chunk(self, chunk: List[Concept], violations: Optional[List[str]] = None, warnings: Optional[List[str]] = None) -> Tuple[List[str], List[str]]:
+        """Run the validators that only need the concepts of one chunk (integrity,
+        semantic relations, datatypes/URIs). Findings are appended to the given lists
+        (new lists if omitted), which are returned.
+        """
+        if violations is None:
+            violations = []
+        if warnings is None:
+            warnings = []
+        for validate in (self._validate_skos_integrity, self._validate_semantic_relations, self._validate_datatypes_and_uris):
+            chunk_violations, chunk_warnings = validate(chunk)
+            violations.extend(chunk_violations)
+            warnings.extend(chunk_warnings)
+        return violations, warnings
+    
+    def _validate_skos_xl_labels(self, concepts: List[Concept], index: Optional[Dict] = None) -> Tuple[List[str], List[str]]:
         """Validate SKOS-XL labels if enabled - simplified to prevent dictionary iteration errors."""
         violations = []
         warnings = []
@@ -1884,13 +2460,17 @@ class TTLCleaner:
         if not self.enable_skos_xl:
             return violations, warnings
         
+        if index is None:
+            index = self._build_validation_indexes(concepts)
+        concept_uris = index['all_uris']
+        
         # Simplified SKOS-XL validation to avoid dictionary iteration issues
         # Check for SKOS-XL properties in other_properties
         xl_label_uris = set()
         
         for concept in concepts:
-            uri = concept.get('uri', 'unknown')
-            other_props = concept.get('other_properties', [])
+            uri = concept.uri
+            other_props = concept.other_properties
             
             # Look for SKOS-XL properties in other_properties list
             for prop in other_props:
@@ -1901,7 +2481,6 @@ class TTLCleaner:
                         xl_label_uris.add(xl_uri)
                         
                         # Check for URI conflicts
-                        concept_uris = [c.get('uri', '') for c in concepts]
                         if xl_uri in concept_uris:
                             warnings.append(
                                 f"SKOS-XL label URI <{xl_uri}> conflicts with concept URI in <{uri}>. "
@@ -1918,12 +2497,16 @@ class TTLCleaner:
         
         return violations, warnings
     
-    def _format_concept(self, concept: Dict) -> str:
+    def _format_concept(self, concept: Concept) -> str:
         """Format concept as TTL."""
-        lines = []
-        
+        lines: List[str] = []
+        self._append_concept_lines(concept, lines)
+        return '\n'.join(lines)
+    
+    def _append_concept_lines(self, concept: Concept, lines: List[str]) -> None:
+        """Append the TTL lines of a concept (subject line, then one line per property) to lines."""
         # URI and type - use relative URI if @base is present
-        uri = concept['uri']
+        uri = concept.uri
         if self.base_uri and uri.startswith(self.base_uri):
             # Convert to relative URI
             relative_uri = f"<{uri[len(self.base_uri):]}>"
@@ -1931,87 +2514,34 @@ class TTLCleaner:
         else:
             lines.append(f"{uri} a skos:Concept ;")
         
-        # Collect all properties to determine correct separators
-        all_properties = []
-        
-        # Add prefLabels
-        for label in concept['prefLabels']:
-            lang_tag = f"@{label['lang']}" if label['lang'] else ""
-            fixed_text = self._fix_comma_spacing(label['text'])
-            all_properties.append(f'skos:prefLabel "{fixed_text}"{lang_tag}')
-            self.stats['labels_processed'] += 1
-        
-        # Add altLabels
-        for label in concept['altLabels']:
-            lang_tag = f"@{label['lang']}" if label['lang'] else ""
-            fixed_text = self._fix_comma_spacing(label['text'])
-            all_properties.append(f'skos:altLabel "{fixed_text}"{lang_tag}')
-            self.stats['labels_processed'] += 1
-        
-        # Add definitions
-        for definition in concept['definitions']:
-            lang_tag = f"@{definition['lang']}" if definition['lang'] else ""
-            fixed_text = self._fix_comma_spacing(definition['text'])
-            all_properties.append(f'skos:definition "{fixed_text}"{lang_tag}')
-            self.stats['definitions_processed'] += 1
-        
-        # Add notes
-        for note in concept['notes']:
-            lang_tag = f"@{note['lang']}" if note['lang'] else ""
-            fixed_text = self._fix_comma_spacing(note['text'])
-            all_properties.append(f'skos:note "{fixed_text}"{lang_tag}')
-            self.stats['notes_processed'] += 1
-        
-        # Add scopeNotes
-        for note in concept['scopeNotes']:
-            lang_tag = f"@{note['lang']}" if note['lang'] else ""
-            fixed_text = self._fix_comma_spacing(note['text'])
-            all_properties.append(f'skos:scopeNote "{fixed_text}"{lang_tag}')
-            self.stats['notes_processed'] += 1
-        
-        # Add editorialNotes
-        for note in concept['editorialNotes']:
-            lang_tag = f"@{note['lang']}" if note['lang'] else ""
-            fixed_text = self._fix_comma_spacing(note['text'])
-            all_properties.append(f'skos:editorialNote "{fixed_text}"{lang_tag}')
-            self.stats['notes_processed'] += 1
-        
-        # Add historyNotes
-        for note in concept['historyNotes']:
-            lang_tag = f"@{note['lang']}" if note['lang'] else ""
-            fixed_text = self._fix_comma_spacing(note['text'])
-            all_properties.append(f'skos:historyNote "{fixed_text}"{lang_tag}')
-            self.stats['notes_processed'] += 1
-        
-        # Add changeNotes
-        for note in concept['changeNotes']:
-            lang_tag = f"@{note['lang']}" if note['lang'] else ""
-            fixed_text = self._fix_comma_spacing(note['text'])
-            all_properties.append(f'skos:changeNote "{fixed_text}"{lang_tag}')
-            self.stats['notes_processed'] += 1
-        
-        # Add examples
-        for example in concept['examples']:
-            lang_tag = f"@{example['lang']}" if example['lang'] else ""
-            fixed_text = self._fix_comma_spacing(example['text'])
-            all_properties.append(f'skos:example "{fixed_text}"{lang_tag}')
-            # text_fields_cleaned is incremented inside _fix_comma_spacing only when changes occur
+        # Each property line is written with the ' ;' separator; the last one is switched to ' .'
+        first_property = len(lines)
+        fix = self._fix_comma_spacing
+        stats = self.stats
+        for attr, head, counter in _LITERAL_OUTPUT:
+            values = getattr(concept, attr)
+            if not values:
+                continue
+            for value in values:
+                lang = value['lang']
+                if lang:
+                    lines.append(f'    {head}{fix(value["text"])}"@{lang} ;')
+                else:
+                    lines.append(f'    {head}{fix(value["text"])}" ;')
+            if counter:
+                stats[counter] += len(values)
         
         # Add other SKOS properties
-        for prop in concept['other_properties']:
+        for prop in concept.other_properties:
             # Clean the property (remove any trailing punctuation)
             clean_prop = prop.rstrip(' ;.,').strip()
             if clean_prop:
-                all_properties.append(clean_prop)
+                lines.append(f'    {clean_prop} ;')
         
-        # Format with correct separators
-        for i, prop in enumerate(all_properties):
-            separator = " ;" if i < len(all_properties) - 1 else " ."
-            lines.append(f'    {prop}{separator}')
-        
-        return '\n'.join(lines)
+        if len(lines) > first_property:
+            lines[-1] = lines[-1][:-1] + '.'
     
-    def _print_report(self, input_path: str, output_path: str):
+    def _print_report(self, input_path: Union[str, Path], output_path: Union[str, Path]):
         """Print cleaning report."""
         print("\n" + "="*60)
         print("TTL CLEANING REPORT")
@@ -2032,8 +2562,7 @@ class TTLCleaner:
         print(f"   Definitions processed: {self.stats['definitions_processed']}")
         print(f"   Notes processed: {self.stats['notes_processed']}")
         
-        final_concepts = self.stats['total_concepts'] - self.stats['duplicates_removed'] - self.stats['concepts_without_preflabel']
-        print(f"   Final concepts in output: {final_concepts}")
+        print(f"   Final concepts in output: {self.stats['final_concepts']}")
         
         if self.errors:
             print(f"\nERRORS ({len(self.errors)}):")
@@ -2051,7 +2580,116 @@ class TTLCleaner:
         
         print("\n[SUCCESS] Cleaning completed!")
 
-if __name__ == "__main__":
+def _available_memory() -> Optional[int]:
+    """Available RAM in bytes (psutil if installed, else sysconf), or None if unknown."""
+    try:
+        import psutil
+        return psutil.virtual_memory().available
+    except ImportError:
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def _auto_chunk_size(available: Optional[int]) -> int:
+    """Chunk size that keeps one chunk within AUTO_CHUNK_RAM_FRACTION of the available RAM,
+    clamped to MIN_AUTO_CHUNK_SIZE..MAX_AUTO_CHUNK_SIZE.
+    """
+    if not available:
+        return MIN_AUTO_CHUNK_SIZE
+    size = int(available * AUTO_CHUNK_RAM_FRACTION / AVG_CONCEPT_BYTES)
+    return min(MAX_AUTO_CHUNK_SIZE, max(MIN_AUTO_CHUNK_SIZE, size))
+
+def _stdout_is_devnull() -> bool:
+    """True if stdout is redirected to os.devnull (output printed there is discarded)."""
+    try:
+        out = os.fstat(sys.stdout.fileno())
+        null = os.stat(os.devnull)
+    except (AttributeError, ValueError, OSError):
+        # No real file descriptor behind stdout (e.g. captured in tests)
+        return False
+    return (out.st_dev, out.st_ino) == (null.st_dev, null.st_ino)
+
+def _write_json_line(data: Dict) -> None:
+    """Write data to stdout as one JSON line, as bytes in one call (orjson if installed, else json)."""
+    try:
+        import orjson
+        line = orjson.dumps(data) + b'\n'
+    except ImportError:
+        import json
+        line = (json.dumps(data, separators=(',', ':')) + '\n').encode('utf-8')
+    sys.stdout.flush()
+    sys.stdout.buffer.write(line)
+    sys.stdout.flush()
+
+def _run_cli(args) -> Tuple[TTLCleaner, bool]:
+    """Build the cleaner for the parsed CLI arguments and process the input file.
+    Returns (cleaner, success).
+    """
+    auto_chunk_size = args.chunk_size is None
+    if auto_chunk_size:
+        args.chunk_size = _auto_chunk_size(_available_memory())
+    
+    # Initialize cleaner with options
+    cleaner = TTLCleaner(
+        chunk_size=args.chunk_size,
+        enable_validation=not args.no_validation,
+        memory_efficient=args.memory_efficient,
+        enable_skos_xl=args.enable_skos_xl,
+        autofix_broader=args.autofix_broader,
+        warn_missing_narrower=args.warn_missing_narrower,
+        preserve_byte_identity=args.preserve_byte_identity,
+        semantic_check=args.semantic_check,
+        parallel=not args.no_parallel,
+        verbose_changelog=not args.brief_change_log,
+        stream_change_log=args.stream_change_log,
+        collect_change_log=not (args.no_reports or args.validate_only),
+        parse_workers=args.parse_workers,
+        output_format=args.output_format
+    )
+    
+    # Print configuration if verbose (one write for the whole block)
+    if args.verbose:
+        config = (
+            ("Chunk size", f"{args.chunk_size} (auto)" if auto_chunk_size else args.chunk_size),
+            ("Memory efficient", args.memory_efficient),
+            ("Parallel validation", not args.no_parallel),
+            ("Parse workers", args.parse_workers),
+            ("Validation enabled", not args.no_validation),
+            ("SKOS-XL enabled", args.enable_skos_xl),
+            ("Autofix broader", args.autofix_broader),
+            ("Warn missing narrower (info)", args.warn_missing_narrower),
+            ("Output format", args.output_format),
+            ("Validate only", args.validate_only),
+            ("Reports enabled", not (args.no_reports or args.validate_only)),
+            ("Preserve byte identity", args.preserve_byte_identity),
+            ("Semantic check", args.semantic_check),
+            ("Profile output", args.profile),
+            ("Text change log entries", not args.brief_change_log),
+            ("Stream change log to disk", args.stream_change_log),
+        )
+        print("".join(f"[CONFIG] {name}: {value}\n" for name, value in config))
+    
+    # Process file
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    if args.validate_only:
+        success = cleaner.validate_only(args.input_file)
+    else:
+        success = cleaner.clean_ttl_file(args.input_file, args.output, generate_reports=not args.no_reports)
+    if args.profile:
+        import pstats
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+        print(f"[INFO] Profile written: {args.profile}", file=sys.stderr)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(20)
+    return cleaner, success
+
+def main() -> int:
+    """Command-line entry point; returns the process exit status."""
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -2082,15 +2720,20 @@ Default Output:
 """
     )
     
-    parser.add_argument('input_file', help='Input TTL file path')
-    parser.add_argument('-o', '--output', help='Output file path (default: input_cleaned.ttl)')
+    parser.add_argument('input_file', type=Path, help='Input TTL file path')
+    parser.add_argument('-o', '--output', type=Path, help='Output file path (default: input_cleaned.ttl)')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Do not print the final summary after a successful run')
     
     # Performance options
-    parser.add_argument('--chunk-size', type=int, default=1000,
-                       help='Chunk size for processing large files (default: 1000)')
+    parser.add_argument('--chunk-size', type=int, default=None,
+                       help='Chunk size for processing large files (default: derived from available RAM, at least 1000)')
     parser.add_argument('--memory-efficient', action='store_true',
-                       help='Enable memory-efficient mode for very large files')
+                       help='Enable memory-efficient mode for very large files (streams concept blocks from the memory-mapped input instead of loading the whole file)')
+    parser.add_argument('--no-parallel', action='store_true',
+                       help='Run validators serially in one process (useful for debugging)')
+    parser.add_argument('--parse-workers', type=int, default=1, metavar='N',
+                       help='Parse concept blocks in N worker processes, in batches of up to 1000 blocks (default: 1)')
     
     # Validation options
     parser.add_argument('--no-validation', action='store_true',
@@ -2103,66 +2746,89 @@ Default Output:
                        help='Report info-level messages when a parent lacks explicit skos:narrower back-link')
     
     # Output options
+    parser.add_argument('--output-format', choices=('ttl', 'nt'), default='ttl',
+                       help="Cleaned output format: 'ttl' (Turtle, default) or 'nt' (N-Triples, one triple per line; default output: input_cleaned.nt)")
     parser.add_argument('--no-reports', action='store_true',
                        help='Skip generating validation and change reports')
     parser.add_argument('--preserve-byte-identity', action='store_true',
                        help='If no transformations are made, copy input bytes to output to preserve exact byte identity')
     parser.add_argument('--semantic-check', action='store_true',
                        help='After writing output, check semantic graph isomorphism (rdflib) and report ISOMORPHIC/DIFFERENT')
+    parser.add_argument('--brief-change-log', action='store_true',
+                       help='Only count label/text field fixes in the statistics, without one change log entry each (saves memory on large files)')
+    parser.add_argument('--stream-change-log', action='store_true',
+                       help='Write change log entries to disk as they are made instead of keeping them in memory until the reports are written')
+    parser.add_argument('--validate-only', action='store_true',
+                       help='Only parse, clean and validate: print the validation report, write no cleaned file and no log files')
+    parser.add_argument('--profile', metavar='FILE',
+                       help='Profile the run with cProfile: write the stats to FILE and print the top 20 functions by cumulative time to stderr (worker processes are not profiled; combine with --no-parallel to include the validators)')
+    parser.add_argument('--json', action='store_true',
+                       help='Print the statistics and validation counts as one JSON line instead of the text summary')
     
     args = parser.parse_args()
     
-    # Initialize cleaner with options
-    cleaner = TTLCleaner(
-        chunk_size=args.chunk_size,
-        enable_validation=not args.no_validation,
-        memory_efficient=args.memory_efficient,
-        enable_skos_xl=args.enable_skos_xl,
-        autofix_broader=args.autofix_broader,
-        warn_missing_narrower=args.warn_missing_narrower,
-        preserve_byte_identity=args.preserve_byte_identity,
-        semantic_check=args.semantic_check
-    )
+    # Fail fast on a missing input, before choosing the chunk size or building the cleaner
+    if not args.input_file.is_file():
+        error = f"Input file not found: {args.input_file}"
+        if args.json:
+            _write_json_line({'success': False, 'error': error})
+        else:
+            print(f"[ERROR] {error}")
+        return 1
     
-    # Print configuration if verbose
-    if args.verbose:
-        print(f"[CONFIG] Chunk size: {args.chunk_size}")
-        print(f"[CONFIG] Memory efficient: {args.memory_efficient}")
-        print(f"[CONFIG] Validation enabled: {not args.no_validation}")
-        print(f"[CONFIG] SKOS-XL enabled: {args.enable_skos_xl}")
-        print(f"[CONFIG] Autofix broader: {args.autofix_broader}")
-        print(f"[CONFIG] Warn missing narrower (info): {args.warn_missing_narrower}")
-        print(f"[CONFIG] Reports enabled: {not args.no_reports}")
-        print(f"[CONFIG] Preserve byte identity: {args.preserve_byte_identity}")
-        print(f"[CONFIG] Semantic check: {args.semantic_check}")
-        print()
+    if args.json:
+        # stdout carries only the JSON line; progress messages and reports go to stderr
+        import contextlib
+        with contextlib.redirect_stdout(sys.stderr):
+            cleaner, success = _run_cli(args)
+        # Machine-readable summary
+        _write_json_line({
+            **cleaner.stats,
+            'violations': len(cleaner.validation_violations),
+            'warnings': len(cleaner.validation_warnings),
+            'infos': len(cleaner.validation_infos),
+            'success': success,
+        })
+        return 0 if success else 1
     
-    # Process file
-    success = cleaner.clean_ttl_file(args.input_file, args.output, generate_reports=not args.no_reports)
+    cleaner, success = _run_cli(args)
+    
+    if success and (args.quiet or _stdout_is_devnull()):
+        # Nobody reads the summary: skip formatting it
+        return 0
     
     if success:
-        print("\n[SUCCESS] TTL file cleaned successfully!")
-        
-        # Print summary statistics
+        # Summary statistics, printed with one write
         stats = cleaner.stats
-        print(f"\nSTATISTICS:")
-        print(f"  Total concepts: {stats['total_concepts']}")
-        print(f"  Final concepts: {stats['final_concepts']}")
-        print(f"  Duplicates removed: {stats['duplicates_removed']}")
-        print(f"  URIs fixed: {stats['malformed_uris_fixed']}")
-        print(f"  Encoding issues fixed: {stats['encoding_issues_fixed']}")
-        
-        if cleaner.enable_validation:
-            print(f"\nVALIDATION RESULTS:")
-            print(f"  Violations: {len(cleaner.validation_violations)}")
-            print(f"  Warnings: {len(cleaner.validation_warnings)}")
-            print(f"  Infos: {len(cleaner.validation_infos)}")
-            
-            if cleaner.validation_violations:
-                print(f"  WARNING: Found {len(cleaner.validation_violations)} SKOS integrity violations!")
+        # --validate-only: only the VALIDATION RESULTS block
+        summary = [] if args.validate_only else [
+            "\n[SUCCESS] TTL file cleaned successfully!",
+            "\nSTATISTICS:",
+            f"  Total concepts: {stats['total_concepts']}",
+            f"  Final concepts: {stats['final_concepts']}",
+            f"  Duplicates removed: {stats['duplicates_removed']}",
+            f"  URIs fixed: {stats['malformed_uris_fixed']}",
+            f"  Encoding issues fixed: {stats['encoding_issues_fixed']}",
+        ]
+        
+        if cleaner.enable_validation or args.validate_only:
+            n_violations = len(cleaner.validation_violations)
+            summary += [
+                "\nVALIDATION RESULTS:",
+                f"  Violations: {n_violations}",
+                f"  Warnings: {len(cleaner.validation_warnings)}",
+                f"  Infos: {len(cleaner.validation_infos)}",
+            ]
+            if n_violations:
+                summary.append(f"  WARNING: Found {n_violations} SKOS integrity violations!")
             else:
-                print(f"  SUCCESS: All SKOS integrity conditions satisfied!")
+                summary.append("  SUCCESS: All SKOS integrity conditions satisfied!")
         
-    else:
-        print("\n[ERROR] Failed to clean TTL file!")
-        exit(1)
+        print("\n".join(summary))
+        return 0
+    
+    print("\n[ERROR] Failed to validate TTL file!" if args.validate_only else "\n[ERROR] Failed to clean TTL file!")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())